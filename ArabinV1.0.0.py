@@ -1,11 +1,20 @@
+import os
 import sys
-import re
+import threading
+import time
 from PyQt5.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QShortcut,
     QTextEdit, QPushButton, QLabel, QMessageBox, QDialog, QDialogButtonBox
 )
-from PyQt5.QtGui import QIcon, QFont, QPixmap
-from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QIcon, QFont, QPixmap, QColor, QTextCharFormat, QTextCursor, QKeySequence
+from PyQt5.QtCore import Qt, QFileSystemWatcher, QThreadPool, pyqtSignal
+
+from arabin_cache import ResultCache
+from arabin_engine import RuleEngine, Composer, OVERLAY_DIR, overlay_files
+
+MAX_UNDERLINES = 1000
+# Prioritas antrean konversi tab yang tidak aktif di kumpulan thread
+BACKGROUND_PRIORITY = -1
 
 class NotificationDialog(QDialog):
     def __init__(self, message, dark_mode=False, parent=None):
@@ -146,7 +155,207 @@ class AboutDialog(QDialog):
                 }
             """
 
+class DocumentTab(QWidget):
+    # Satu dokumen: pasangan input/output beserta status komposisinya.
+    # Mesin, cache, dan kumpulan thread dipegang jendela dan dipakai bersama.
+    def __init__(self, engine, parent=None):
+        super().__init__(parent)
+        label_input = QLabel("Teks Latin:")
+        label_input.setFont(QFont("Sans Serif", 10, QFont.Bold))
+
+        self.text_input = QTextEdit()
+        self.text_input.setPlaceholderText("Masukkan teks Latin di sini...")
+        self.text_input.setFont(QFont("Sans Serif", 11))
+
+        label_output = QLabel("Hasil Transliterasi:")
+        label_output.setFont(QFont("Sans Serif", 10, QFont.Bold))
+
+        self.text_output = QTextEdit()
+        self.text_output.setReadOnly(True)
+        self.text_output.setPlaceholderText("سيظهر النص العربي هنا")
+        self.text_output.setFont(QFont("Arabic Typesetting, Arial", 32))
+        self.text_output.setAlignment(Qt.AlignRight)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 10, 0, 0)
+        layout.setSpacing(10)
+        layout.addWidget(label_input)
+        layout.addWidget(self.text_input)
+        layout.addWidget(label_output)
+        layout.addWidget(self.text_output)
+
+        # Status komposisi mode ketik langsung
+        self.composer = Composer(engine)
+        self.pending_start = None
+        self.pending_length = 0
+
+        # Konversi latar belakang yang sedang antre/berjalan untuk tab ini
+        self.job = None
+        # Hasil saat tab tersembunyi: disimpan sebagai str saja, tanpa
+        # dokumen dan tata letak teks Arab di QTextEdit
+        self.output = None
+
+    def has_input(self):
+        return bool(self.text_input.toPlainText().strip())
+
+    def has_output(self):
+        return self.output is not None or not self.text_output.document().isEmpty()
+
+    def set_output(self, output_text, visible):
+        if visible:
+            self.output = None
+            self.text_output.setPlainText(output_text)
+            self.text_output.verticalScrollBar().setValue(0)
+        else:
+            self.output = output_text
+            self.text_output.clear()
+
+    def release_output(self):
+        if self.output is None and not self.text_output.document().isEmpty():
+            self.output = self.text_output.toPlainText()
+            self.text_output.clear()
+
+    def restore_output(self):
+        if self.output is not None:
+            output_text = self.output
+            self.output = None
+            self.set_output(output_text, True)
+
+    def cancel_job(self):
+        if self.job is not None:
+            self.job.cancel()
+            self.job = None
+
+    def compose_key(self, event):
+        if event.modifiers() & (Qt.ControlModifier | Qt.AltModifier):
+            return False
+        # Kursor dipindah pengguna: kirim dulu komposisi lama di tempatnya
+        if self.pending_start is not None and \
+                self.text_input.textCursor().position() != self.pending_start + self.pending_length:
+            self.flush_composition()
+        if event.key() == Qt.Key_Backspace and self.pending_start is not None:
+            self.show_composition(self.composer.backspace())
+            return True
+        text = event.text()
+        if len(text) != 1 or not text.isprintable():
+            return False
+        self.show_composition(self.composer.feed(text))
+        return True
+
+    def flush_composition(self):
+        if self.pending_start is not None:
+            self.show_composition(self.composer.flush(), move_cursor=False)
+
+    def show_composition(self, committed, move_cursor=True):
+        # Hanya rentang komposisi yang diganti: huruf Arab yang sudah pasti,
+        # lalu huruf Latin yang masih menunggu (bergaris bawah)
+        if self.pending_start is None:
+            cursor = self.text_input.textCursor()
+        else:
+            cursor = QTextCursor(self.text_input.document())
+            cursor.setPosition(self.pending_start)
+            cursor.setPosition(self.pending_start + self.pending_length, QTextCursor.KeepAnchor)
+        cursor.insertText(committed, QTextCharFormat())
+        pending = self.composer.pending
+        if pending:
+            self.pending_start = cursor.position()
+            self.pending_length = len(pending)
+            underline = QTextCharFormat()
+            underline.setFontUnderline(True)
+            cursor.insertText(pending, underline)
+        else:
+            self.pending_start = None
+            self.pending_length = 0
+        if move_cursor:
+            cursor.setCharFormat(QTextCharFormat())
+            self.text_input.setTextCursor(cursor)
+
+    def show_diagnostics(self, diagnostics, offset=0):
+        underline = QTextCharFormat()
+        underline.setUnderlineStyle(QTextCharFormat.WaveUnderline)
+        underline.setUnderlineColor(QColor("#e05555"))
+        underline.setToolTip("Tidak ada aturan untuk huruf ini")
+        selections = []
+        # Dibatasi agar teks non-Arab yang panjang tidak membuat editor lambat
+        for diagnostic in diagnostics[:MAX_UNDERLINES]:
+            cursor = QTextCursor(self.text_input.document())
+            cursor.setPosition(offset + diagnostic.start)
+            cursor.setPosition(offset + diagnostic.end, QTextCursor.KeepAnchor)
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = cursor
+            selection.format = underline
+            selections.append(selection)
+        self.text_input.setExtraSelections(selections)
+
+    def reset(self):
+        self.cancel_job()
+        self.text_input.clear()
+        self.text_input.setExtraSelections([])
+        self.composer.reset()
+        self.pending_start = None
+        self.pending_length = 0
+        self.output = None
+        self.text_output.clear()
+
+
+class ConversionJob:
+    # Konversi satu tab di kumpulan thread bersama. Teks input sudah disalin
+    # di thread GUI dan mesin tidak pernah berubah, jadi tidak ada yang
+    # dibagi dengan thread GUI selain status pekerjaan ini.
+    def __init__(self, tab, engine, text, leading, revision):
+        self.tab = tab
+        self.engine = engine
+        self.text = text
+        self.leading = leading
+        # Revisi dokumen input saat diantrekan, untuk mengenali suntingan
+        # selama pekerjaan berjalan
+        self.revision = revision
+        self._state = "queued"
+        self._lock = threading.Lock()
+
+    def claim(self):
+        # Tab menjadi aktif sebelum pekerjaan dimulai: thread GUI mengambil alih
+        with self._lock:
+            if self._state != "queued":
+                return False
+            self._state = "taken"
+            return True
+
+    def cancel(self):
+        with self._lock:
+            self._state = "cancelled"
+
+    def cancelled(self):
+        return self._state == "cancelled"
+
+    def run(self, cache, done):
+        with self._lock:
+            if self._state != "queued":
+                return
+            self._state = "running"
+        # Prioritas thread sengaja dibiarkan biasa: thread berprioritas rendah
+        # yang tertahan saat memegang GIL ikut menahan thread GUI
+        diagnostics = []
+        chunks = []
+        text, self.text = self.text, None
+        for chunk in cache.iter_transliterate(self.engine, text, diagnostics):
+            if self.cancelled():
+                return
+            chunks.append(chunk)
+            # Beri kesempatan thread GUI mengambil GIL di antara potongan
+            time.sleep(0)
+        del text
+        try:
+            done.emit(self, ("".join(chunks), diagnostics))
+        except RuntimeError:
+            # Jendela sudah ditutup
+            pass
+
+
 class Transliterator(QWidget):
+    # Hasil konversi latar belakang, dikirim dari thread kumpulan ke thread GUI
+    converted = pyqtSignal(object, object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Arabin")
@@ -177,6 +386,13 @@ class Transliterator(QWidget):
         title_layout.addWidget(title)
         title_layout.addStretch()
 
+        # Tombol mode ketik langsung (huruf Arab muncul saat mengetik)
+        self.ime_button = QPushButton("ع")
+        self.ime_button.setFixedSize(30, 30)
+        self.ime_button.setCheckable(True)
+        self.ime_button.setToolTip("Mode ketik langsung")
+        self.ime_button.toggled.connect(self.toggle_ime)
+
         # Tombol dark/light mode
         self.mode_button = QPushButton("🌙")
         self.mode_button.setFixedSize(30, 30)
@@ -189,26 +405,26 @@ class Transliterator(QWidget):
 
         header.addLayout(title_layout)
         header.addStretch()
+        header.addWidget(self.ime_button)
         header.addWidget(self.mode_button)
         header.addWidget(about_button)
 
-        # ===== TEXT AREA =====
-        label_input = QLabel("Teks Latin:")
-        label_input.setFont(QFont("Sans Serif", 10, QFont.Bold))
+        # ===== TABS =====
+        self.tabs = QTabWidget()
+        self.tabs.setTabsClosable(True)
+        self.tabs.setMovable(True)
+        self.tabs.setDocumentMode(True)
+        self.tabs.currentChanged.connect(self.switch_tab)
+        self.tabs.tabCloseRequested.connect(self.close_tab)
 
-        self.text_input = QTextEdit()
-        self.text_input.setPlaceholderText("Masukkan teks Latin di sini...")
-        self.text_input.setFont(QFont("Sans Serif", 11))
-        self.text_input.setFocus()
+        new_tab_button = QPushButton("+")
+        new_tab_button.setFixedSize(26, 26)
+        new_tab_button.setToolTip("Tab baru (Ctrl+T)")
+        new_tab_button.clicked.connect(self.new_tab)
+        self.tabs.setCornerWidget(new_tab_button, Qt.TopRightCorner)
 
-        label_output = QLabel("Hasil Transliterasi:")
-        label_output.setFont(QFont("Sans Serif", 10, QFont.Bold))
-
-        self.text_output = QTextEdit()
-        self.text_output.setReadOnly(True)
-        self.text_output.setPlaceholderText("سيظهر النص العربي هنا")
-        self.text_output.setFont(QFont("Arabic Typesetting, Arial", 32))
-        self.text_output.setAlignment(Qt.AlignRight)
+        QShortcut(QKeySequence("Ctrl+T"), self, self.new_tab)
+        QShortcut(QKeySequence("Ctrl+W"), self, lambda: self.close_tab(self.tabs.currentIndex()))
 
         # ===== BUTTONS =====
         button_layout = QHBoxLayout()
@@ -229,35 +445,112 @@ class Transliterator(QWidget):
         button_layout.addWidget(self.reset_button)
 
         # ===== VERSION =====
-        version_label = QLabel("Arabin v1.0 © 2025 Uiscript")
-        version_label.setAlignment(Qt.AlignCenter)
-        version_label.setStyleSheet("color: gray; font-size: 10pt;")
+        self.version_label = QLabel("Arabin v1.0 © 2025 Uiscript")
+        self.version_label.setAlignment(Qt.AlignCenter)
+        self.version_label.setStyleSheet("color: gray; font-size: 10pt;")
 
         # ===== MAIN LAYOUT =====
         main_layout = QVBoxLayout()
         main_layout.setSpacing(10)
         main_layout.addLayout(header)
-        main_layout.addWidget(label_input)
-        main_layout.addWidget(self.text_input)
-        main_layout.addWidget(label_output)
-        main_layout.addWidget(self.text_output)
+        main_layout.addWidget(self.tabs)
         main_layout.addLayout(button_layout)
-        main_layout.addWidget(version_label)
+        main_layout.addWidget(self.version_label)
 
         self.setLayout(main_layout)
 
-        # Enable Ctrl+Enter
-        self.text_input.keyPressEvent = self.handle_keypress
-
         # Apply initial mode
         self.apply_dark_mode()
 
+        # Mesin transliterasi + aturan pengguna (dimuat ulang saat berkas
+        # berubah), satu untuk semua tab
+        self.engine = RuleEngine()
+        self.cache = ResultCache()
+
+        # Satu thread pekerja untuk konversi tab yang tidak aktif. Konversi
+        # berjalan di bawah GIL, jadi thread tambahan tidak mempercepatnya dan
+        # hanya menambah rebutan GIL dengan thread GUI
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.converted.connect(self.finish_conversion)
+
+        self.tab_count = 0
+        self.current = None
+        self.new_tab()
+
+        self.overlay_watcher = QFileSystemWatcher(self)
+        self.overlay_watcher.fileChanged.connect(self.reload_overlay)
+        self.overlay_watcher.directoryChanged.connect(self.scan_overlays)
+        self.scan_overlays()
+
+    # Tab aktif; text_input/text_output/composer tetap tersedia di jendela
+    @property
+    def text_input(self):
+        return self.current.text_input
+
+    @property
+    def text_output(self):
+        return self.current.text_output
+
+    @property
+    def composer(self):
+        return self.current.composer
+
+    def new_tab(self):
+        tab = DocumentTab(self.engine)
+        # Enable Ctrl+Enter
+        tab.text_input.keyPressEvent = self.handle_keypress
+        self.tab_count += 1
+        self.tabs.setCurrentIndex(self.tabs.addTab(tab, "Dokumen %d" % self.tab_count))
+        tab.text_input.setFocus()
+        return tab
+
+    def close_tab(self, index):
+        tab = self.tabs.widget(index)
+        if tab is None:
+            return
+        if self.tabs.count() == 1:
+            # Tab terakhir tidak ditutup, cukup dikosongkan
+            tab.reset()
+            return
+        tab.cancel_job()
+        self.tabs.removeTab(index)
+        tab.deleteLater()
+
+    def switch_tab(self, index):
+        tab = self.tabs.widget(index)
+        if tab is None or tab is self.current:
+            return
+        if self.current is not None and self.tabs.indexOf(self.current) != -1:
+            self.current.flush_composition()
+            # Tab yang tidak terlihat melepas tata letak hasilnya
+            self.current.release_output()
+        self.current = tab
+        tab.restore_output()
+        # Masih antre di latar belakang: langsung dikerjakan di sini
+        if tab.job is not None and tab.job.claim():
+            tab.job = None
+            self.transliterate()
+        tab.text_input.setFocus()
+
     def handle_keypress(self, event):
-        if event.modifiers() == Qt.ControlModifier and event.key() == Qt.Key_Return:
+        if event.modifiers() == (Qt.ControlModifier | Qt.ShiftModifier) and event.key() == Qt.Key_Return:
+            self.current.flush_composition()
+            self.transliterate_all()
+        elif event.modifiers() == Qt.ControlModifier and event.key() == Qt.Key_Return:
+            self.current.flush_composition()
             self.transliterate()
+        elif self.ime_button.isChecked() and self.current.compose_key(event):
+            return
         else:
+            self.current.flush_composition()
             QTextEdit.keyPressEvent(self.text_input, event)
 
+    def toggle_ime(self, checked):
+        if not checked:
+            self.current.flush_composition()
+        self.text_input.setFocus()
+
     def toggle_mode(self):
         if self.dark_mode:
             self.apply_light_mode()
@@ -292,6 +585,18 @@ class Transliterator(QWidget):
             QLabel {
                 color: #cccccc;
             }
+            QTabBar::tab {
+                background-color: #3c3f41;
+                color: #cccccc;
+                border: 1px solid #555;
+                padding: 4px 10px;
+                border-top-left-radius: 4px;
+                border-top-right-radius: 4px;
+            }
+            QTabBar::tab:selected {
+                background-color: #1e1e1e;
+                color: #f0f0f0;
+            }
         """)
 
     def apply_light_mode(self):
@@ -319,565 +624,143 @@ class Transliterator(QWidget):
             QLabel {
                 color: #444444;
             }
+            QTabBar::tab {
+                background-color: #e0e0e0;
+                color: #444444;
+                border: 1px solid #ccc;
+                padding: 4px 10px;
+                border-top-left-radius: 4px;
+                border-top-right-radius: 4px;
+            }
+            QTabBar::tab:selected {
+                background-color: #ffffff;
+                color: #2b2b2b;
+            }
         """)
 
+    def scan_overlays(self):
+        # Folder ikut dipantau agar berkas aturan baru/terhapus juga terdeteksi
+        if os.path.isdir(OVERLAY_DIR) and OVERLAY_DIR not in self.overlay_watcher.directories():
+            self.overlay_watcher.addPath(OVERLAY_DIR)
+        paths = overlay_files()
+        if paths == self.engine.overlays():
+            return
+        # Urutan lapisan mengikuti nama berkas, jadi susun ulang semuanya
+        engine = self.engine
+        for path in engine.overlays():
+            engine = engine.without_overlay(path)
+        for path in paths:
+            engine = self.load_overlay(engine, path)
+        self.set_engine(engine)
+
+    def reload_overlay(self, path):
+        if path not in self.engine.overlays():
+            # Belum menjadi lapisan (misalnya gagal dimuat saat mulai): susun
+            # ulang semuanya agar tetap urut nama berkas, bukan masuk di akhir
+            self.scan_overlays()
+            return
+        self.set_engine(self.load_overlay(self.engine, path))
+
+    def load_overlay(self, engine, path):
+        if not os.path.exists(path):
+            return engine.without_overlay(path)
+        # Editor sering menyimpan dengan mengganti berkas, pantau lagi
+        if path not in self.overlay_watcher.files():
+            self.overlay_watcher.addPath(path)
+        try:
+            return engine.with_overlay_file(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Peringatan", "Aturan pengguna tidak bisa dimuat:\n%s" % e)
+            return engine
+
+    def set_engine(self, engine):
+        # Komposisi yang sedang berjalan memegang simpul trie mesin lama
+        changed = engine.version() != self.engine.version()
+        self.engine = engine
+        tabs = [self.tabs.widget(index) for index in range(self.tabs.count())]
+        for tab in tabs:
+            tab.flush_composition()
+            tab.composer = Composer(engine)
+        if not changed:
+            return
+        # Tab aktif dikonversi ulang langsung, tab lain di latar belakang.
+        # Input yang sudah dikosongkan dilewati (tanpa peringatan yang tidak
+        # dipicu pengguna); hasil lamanya dibiarkan.
+        for tab in tabs:
+            if tab.has_output() and tab.has_input():
+                if tab is self.current:
+                    self.transliterate()
+                else:
+                    self.queue_conversion(tab)
+
+    def queue_conversion(self, tab):
+        tab.cancel_job()
+        input_text = tab.text_input.toPlainText()
+        leading = next((i for i, char in enumerate(input_text) if not char.isspace()), len(input_text))
+        input_text = input_text.strip()
+        if not input_text:
+            return
+        job = ConversionJob(tab, self.engine, input_text, leading, tab.text_input.document().revision())
+        del input_text
+        tab.job = job
+        cache, done = self.cache, self.converted
+        self.pool.start(lambda: job.run(cache, done), BACKGROUND_PRIORITY)
+
+    def finish_conversion(self, job, result):
+        tab = job.tab
+        # Sudah digantikan pekerjaan lain, dibatalkan, atau tabnya ditutup
+        if job is not tab.job or self.tabs.indexOf(tab) == -1:
+            return
+        tab.job = None
+        output_text, diagnostics = result
+        tab.set_output(output_text, tab is self.current)
+        if tab.text_input.document().revision() == job.revision:
+            tab.show_diagnostics(diagnostics, job.leading)
+        else:
+            # Input disunting selama konversi: posisi diagnostik sudah tidak
+            # cocok lagi dengan teksnya
+            tab.text_input.setExtraSelections([])
+        self.show_cache_stats()
+
     def show_about(self):
         dialog = AboutDialog(dark_mode=self.dark_mode, parent=self)
         dialog.exec_()
 
     def transliterate(self):
-        input_text = self.text_input.toPlainText().strip()
+        tab = self.current
+        tab.cancel_job()
+        # Hanya satu salinan input di Python: spasi awal dihitung tanpa
+        # membuat salinan kedua, lalu teks yang di-strip menggantikannya
+        input_text = tab.text_input.toPlainText()
+        leading = next((i for i, char in enumerate(input_text) if not char.isspace()), len(input_text))
+        input_text = input_text.strip()
 
         if not input_text:
             QMessageBox.warning(self, "Peringatan", "Teks input tidak boleh kosong.")
             return
 
-        output_text = input_text
-        # Input Husus
-        output_text = re.sub(r'\'alaa', 'عَلٰى', output_text)
-        output_text = re.sub(r'dzaalika', 'ذٰلِكَ', output_text)
-        output_text = re.sub(r'--', 'ال', output_text)
-        output_text = re.sub(r'-', 'ا', output_text)
-        output_text = re.sub(r'TaN', 'ةً', output_text)
-        output_text = re.sub(r'TiN', 'ةٍ', output_text)
-        output_text = re.sub(r'TuN', 'ةٌ', output_text)
-        output_text = re.sub(r'Ta', 'ةَ', output_text)
-        output_text = re.sub(r'Ti', 'ةِ', output_text)
-        output_text = re.sub(r'Tu', 'ةُ', output_text)
-        output_text = re.sub(r',', '،', output_text)
-        # input StaNdar
-        output_text = re.sub(r'cchuu', 'خُّوْ', output_text)
-        output_text = re.sub(r'cchii', 'خِّيْ', output_text)
-        output_text = re.sub(r'cchoo', 'خَّا', output_text)
-        output_text = re.sub(r'cchuN', 'خٌّ', output_text)
-        output_text = re.sub(r'cchiN', 'خٍّ', output_text)
-        output_text = re.sub(r'cchaN', 'خًّ', output_text)
-        output_text = re.sub(r'ddhuu', 'ظُّوْ', output_text)
-        output_text = re.sub(r'ddhii', 'ظِّيْ', output_text)
-        output_text = re.sub(r'ddhoo', 'ظَّا', output_text)
-        output_text = re.sub(r'ddhuN', 'ظٌّ', output_text)
-        output_text = re.sub(r'ddhiN', 'ظٍّ', output_text)
-        output_text = re.sub(r'ddhaN', 'ظًّ', output_text)
-        output_text = re.sub(r'ddluu', 'ضُّوْ', output_text)
-        output_text = re.sub(r'ddlii', 'ضِّيْ', output_text)
-        output_text = re.sub(r'ddloo', 'ضَّا', output_text)
-        output_text = re.sub(r'ddluN', 'ضٌّ', output_text)
-        output_text = re.sub(r'ddliN', 'ضٍّ', output_text)
-        output_text = re.sub(r'ddlaN', 'ضًّ', output_text)
-        output_text = re.sub(r'ddzuu', 'ذُّوْ', output_text)
-        output_text = re.sub(r'ddzii', 'ذِّيْ', output_text)
-        output_text = re.sub(r'ddzaa', 'ذَّا', output_text)
-        output_text = re.sub(r'ddzuN', 'ذٌّ', output_text)
-        output_text = re.sub(r'ddziN', 'ذٍّ', output_text)
-        output_text = re.sub(r'ddzaN', 'ذًّ', output_text)
-        output_text = re.sub(r'gghuu', 'غُّوْ', output_text)
-        output_text = re.sub(r'gghii', 'غِّيْ', output_text)
-        output_text = re.sub(r'gghoo', 'غَّا', output_text)
-        output_text = re.sub(r'gghuN', 'غٌّ', output_text)
-        output_text = re.sub(r'gghiN', 'غٍّ', output_text)
-        output_text = re.sub(r'gghoN', 'غًّ', output_text)
-        output_text = re.sub(r'kkhuu', 'حُّوْ', output_text)
-        output_text = re.sub(r'kkhii', 'حِّيْ', output_text)
-        output_text = re.sub(r'kkhaa', 'حَّا', output_text)
-        output_text = re.sub(r'kkhuN', 'حٌّ', output_text)
-        output_text = re.sub(r'kkhiN', 'حٍّ', output_text)
-        output_text = re.sub(r'kkhaN', 'حًّ', output_text)
-        output_text = re.sub(r'sshuu', 'صُّوْ', output_text)
-        output_text = re.sub(r'sshii', 'صِّيْ', output_text)
-        output_text = re.sub(r'sshoo', 'صَّا', output_text)
-        output_text = re.sub(r'sshuN', 'صٌّ', output_text)
-        output_text = re.sub(r'sshiN', 'صٍّ', output_text)
-        output_text = re.sub(r'sshaN', 'صًّ', output_text)
-        output_text = re.sub(r'ssyuu', 'شُّوْ', output_text)
-        output_text = re.sub(r'ssyii', 'شِّيْ', output_text)
-        output_text = re.sub(r'ssyaa', 'شَّا', output_text)
-        output_text = re.sub(r'ssyuN', 'شٌّ', output_text)
-        output_text = re.sub(r'ssyiN', 'شٍّ', output_text)
-        output_text = re.sub(r'ssyaN', 'شًّ', output_text)
-        output_text = re.sub(r'tthuu', 'طُّوْ', output_text)
-        output_text = re.sub(r'tthii', 'طِّيْ', output_text)
-        output_text = re.sub(r'tthoo', 'طَّا', output_text)
-        output_text = re.sub(r'tthuN', 'طٌّ', output_text)
-        output_text = re.sub(r'tthiN', 'طٍّ', output_text)
-        output_text = re.sub(r'tthoN', 'طًّ', output_text)
-        output_text = re.sub(r'ttsuu', 'ثُّوْ', output_text)
-        output_text = re.sub(r'ttsii', 'ثِّيْ', output_text)
-        output_text = re.sub(r'ttsaa', 'ثَّا', output_text)
-        output_text = re.sub(r'ttsuN', 'ثٌّ', output_text)
-        output_text = re.sub(r'ttsiN', 'ثٍّ', output_text)
-        output_text = re.sub(r'ttsaN', 'ثًّ', output_text)
-        output_text = re.sub(r'bbuu', 'بُّوْ', output_text)
-        output_text = re.sub(r'bbii', 'بِّيْ', output_text)
-        output_text = re.sub(r'bbaa', 'بَّا', output_text)
-        output_text = re.sub(r'bbuN', 'بٌّ', output_text)
-        output_text = re.sub(r'bbiN', 'بٍّ', output_text)
-        output_text = re.sub(r'bbaN', 'بًّ', output_text)
-        output_text = re.sub(r'dduu', 'دُّوْ', output_text)
-        output_text = re.sub(r'ddii', 'دِّيْ', output_text)
-        output_text = re.sub(r'ddaa', 'دَّا', output_text)
-        output_text = re.sub(r'dduN', 'دٌّ', output_text)
-        output_text = re.sub(r'ddiN', 'دٍّ', output_text)
-        output_text = re.sub(r'ddaN', 'دًّ', output_text)
-        output_text = re.sub(r'ffuu', 'فُّوْ', output_text)
-        output_text = re.sub(r'ffii', 'فِّيْ', output_text)
-        output_text = re.sub(r'ffaa', 'فَّا', output_text)
-        output_text = re.sub(r'ffuN', 'فٌّ', output_text)
-        output_text = re.sub(r'ffiN', 'فٍّ', output_text)
-        output_text = re.sub(r'ffaN', 'فًّ', output_text)
-        output_text = re.sub(r'hhuu', 'هُّوْ', output_text)
-        output_text = re.sub(r'hhii', 'هِّيْ', output_text)
-        output_text = re.sub(r'hhaa', 'هَّا', output_text)
-        output_text = re.sub(r'hhuN', 'هٌّ', output_text)
-        output_text = re.sub(r'hhiN', 'هٍّ', output_text)
-        output_text = re.sub(r'hhaN', 'هًّ', output_text)
-        output_text = re.sub(r'jjuu', 'جُّوْ', output_text)
-        output_text = re.sub(r'jjii', 'جِّيْ', output_text)
-        output_text = re.sub(r'jjaa', 'جَّا', output_text)
-        output_text = re.sub(r'jjuN', 'جٌّ', output_text)
-        output_text = re.sub(r'jjiN', 'جٍّ', output_text)
-        output_text = re.sub(r'jjaN', 'جًّ', output_text)
-        output_text = re.sub(r'kkuu', 'كُّوْ', output_text)
-        output_text = re.sub(r'kkii', 'كِّيْ', output_text)
-        output_text = re.sub(r'kkaa', 'كَّا', output_text)
-        output_text = re.sub(r'kkuN', 'كٌّ', output_text)
-        output_text = re.sub(r'kkiN', 'كٍّ', output_text)
-        output_text = re.sub(r'kkaN', 'كًّ', output_text)
-        output_text = re.sub(r'lluu', 'لُّوْ', output_text)
-        output_text = re.sub(r'llii', 'لِّيْ', output_text)
-        output_text = re.sub(r'llaa', 'لَّا', output_text)
-        output_text = re.sub(r'lluN', 'لٌّ', output_text)
-        output_text = re.sub(r'lliN', 'لٍّ', output_text)
-        output_text = re.sub(r'llaN', 'لًّ', output_text)
-        output_text = re.sub(r'mmuu', 'مُّوْ', output_text)
-        output_text = re.sub(r'mmii', 'مِّيْ', output_text)
-        output_text = re.sub(r'mmaa', 'مَّا', output_text)
-        output_text = re.sub(r'mmuN', 'مٌّ', output_text)
-        output_text = re.sub(r'mmiN', 'مٍّ', output_text)
-        output_text = re.sub(r'mmaN', 'مًّ', output_text)
-        output_text = re.sub(r'nnuu', 'نُّوْ', output_text)
-        output_text = re.sub(r'nnii', 'نِّيْ', output_text)
-        output_text = re.sub(r'nnaa', 'نَّا', output_text)
-        output_text = re.sub(r'nnuN', 'نٌّ', output_text)
-        output_text = re.sub(r'nniN', 'نٍّ', output_text)
-        output_text = re.sub(r'nnaN', 'نًّ', output_text)
-        output_text = re.sub(r'qquu', 'قُّوْ', output_text)
-        output_text = re.sub(r'qqii', 'قِّيْ', output_text)
-        output_text = re.sub(r'qqo', 'قَّا', output_text)
-        output_text = re.sub(r'qquN', 'قٌّ', output_text)
-        output_text = re.sub(r'qqiN', 'قٍّ', output_text)
-        output_text = re.sub(r'qqoN', 'قًّ', output_text)
-        output_text = re.sub(r'rruu', 'رُّوْ', output_text)
-        output_text = re.sub(r'rrii', 'رِّيْ', output_text)
-        output_text = re.sub(r'rroo', 'رَّا', output_text)
-        output_text = re.sub(r'rruN', 'رٌّ', output_text)
-        output_text = re.sub(r'rriN', 'رٍّ', output_text)
-        output_text = re.sub(r'rron', 'رًّ', output_text)
-        output_text = re.sub(r'ssuu', 'سُّوْ', output_text)
-        output_text = re.sub(r'ssii', 'سِّيْ', output_text)
-        output_text = re.sub(r'ssaa', 'سَّا', output_text)
-        output_text = re.sub(r'ssuN', 'سٌّ', output_text)
-        output_text = re.sub(r'ssiN', 'سٍّ', output_text)
-        output_text = re.sub(r'ssaN', 'سًّ', output_text)
-        output_text = re.sub(r'ttuu', 'تُّوْ', output_text)
-        output_text = re.sub(r'ttii', 'تِّيْ', output_text)
-        output_text = re.sub(r'ttaa', 'تَّا', output_text)
-        output_text = re.sub(r'ttuN', 'تٌّ', output_text)
-        output_text = re.sub(r'ttiN', 'تٍّ', output_text)
-        output_text = re.sub(r'ttaN', 'تًّ', output_text)
-        output_text = re.sub(r'wwuu', 'وُّوْ', output_text)
-        output_text = re.sub(r'wwii', 'وِّيْ', output_text)
-        output_text = re.sub(r'wwaa', 'وَّا', output_text)
-        output_text = re.sub(r'wwuN', 'وٌّ', output_text)
-        output_text = re.sub(r'wwiN', 'وٍّ', output_text)
-        output_text = re.sub(r'wwaN', 'وًّ', output_text)
-        output_text = re.sub(r'yyuu', 'يُّوْ', output_text)
-        output_text = re.sub(r'yyii', 'يِّيْ', output_text)
-        output_text = re.sub(r'yyaa', 'يَّا', output_text)
-        output_text = re.sub(r'yyuN', 'يٌّ', output_text)
-        output_text = re.sub(r'yyiN', 'يٍّ', output_text)
-        output_text = re.sub(r'yyaN', 'يًّ', output_text)
-        output_text = re.sub(r'zzuu', 'زُّوْ', output_text)
-        output_text = re.sub(r'zzii', 'زِّيْ', output_text)
-        output_text = re.sub(r'zzaa', 'زَّا', output_text)
-        output_text = re.sub(r'zzuN', 'زٌّ', output_text)
-        output_text = re.sub(r'zziN', 'زٍّ', output_text)
-        output_text = re.sub(r'zzaN', 'زًّ', output_text)
-        output_text = re.sub(r'\'\'uu', 'عُّوْ', output_text)
-        output_text = re.sub(r'\'\'ii', 'عِّيْ', output_text)
-        output_text = re.sub(r'\'\'aa', 'عَّا', output_text)
-        output_text = re.sub(r'\'\'uN', 'عٌّ', output_text)
-        output_text = re.sub(r'\'\'iN', 'عٍّ', output_text)
-        output_text = re.sub(r'\'\'aN', 'عًّ', output_text)
-        output_text = re.sub(r'cchu', 'خُّ', output_text)
-        output_text = re.sub(r'cchi', 'خِّ', output_text)
-        output_text = re.sub(r'ccha', 'خَّ', output_text)
-        output_text = re.sub(r'ddhu', 'ظُّ', output_text)
-        output_text = re.sub(r'ddhi', 'ظِّ', output_text)
-        output_text = re.sub(r'ddha', 'ظَّ', output_text)
-        output_text = re.sub(r'ddlu', 'ضُّ', output_text)
-        output_text = re.sub(r'ddli', 'ضِّ', output_text)
-        output_text = re.sub(r'ddla', 'ضَّ', output_text)
-        output_text = re.sub(r'ddzu', 'ذُّ', output_text)
-        output_text = re.sub(r'ddzi', 'ذِّ', output_text)
-        output_text = re.sub(r'ddza', 'ذَّ', output_text)
-        output_text = re.sub(r'gghu', 'غُّ', output_text)
-        output_text = re.sub(r'gghi', 'غِّ', output_text)
-        output_text = re.sub(r'ggha', 'غَّ', output_text)
-        output_text = re.sub(r'kkhu', 'حُّ', output_text)
-        output_text = re.sub(r'kkhi', 'حِّ', output_text)
-        output_text = re.sub(r'kkha', 'حَّ', output_text)
-        output_text = re.sub(r'sshu', 'صُّ', output_text)
-        output_text = re.sub(r'sshi', 'صِّ', output_text)
-        output_text = re.sub(r'ssha', 'صَّ', output_text)
-        output_text = re.sub(r'ssyu', 'شُّ', output_text)
-        output_text = re.sub(r'ssyi', 'شِّ', output_text)
-        output_text = re.sub(r'ssya', 'شَّ', output_text)
-        output_text = re.sub(r'tthu', 'طُّ', output_text)
-        output_text = re.sub(r'tthi', 'طِّ', output_text)
-        output_text = re.sub(r'ttho', 'طَّ', output_text)
-        output_text = re.sub(r'ttsu', 'ثُّ', output_text)
-        output_text = re.sub(r'ttsi', 'ثِّ', output_text)
-        output_text = re.sub(r'ttsa', 'ثَّ', output_text)
-        output_text = re.sub(r'chuu', 'خُوْ', output_text)
-        output_text = re.sub(r'chii', 'خِيْ', output_text)
-        output_text = re.sub(r'choo', 'خَا', output_text)
-        output_text = re.sub(r'chuN', 'خٌ', output_text)
-        output_text = re.sub(r'chiN', 'خٍ', output_text)
-        output_text = re.sub(r'chaN', 'خً', output_text)
-        output_text = re.sub(r'dhuu', 'ظُوْ', output_text)
-        output_text = re.sub(r'dhii', 'ظِيْ', output_text)
-        output_text = re.sub(r'dhoo', 'ظَا', output_text)
-        output_text = re.sub(r'dhuN', 'ظٌ', output_text)
-        output_text = re.sub(r'dhiN', 'ظٍ', output_text)
-        output_text = re.sub(r'dhaN', 'ظً', output_text)
-        output_text = re.sub(r'dluu', 'ضُوْ', output_text)
-        output_text = re.sub(r'dlii', 'ضِيْ', output_text)
-        output_text = re.sub(r'dloo', 'ضَا', output_text)
-        output_text = re.sub(r'dluN', 'ضٌ', output_text)
-        output_text = re.sub(r'dliN', 'ضٍ', output_text)
-        output_text = re.sub(r'dlaN', 'ضً', output_text)
-        output_text = re.sub(r'dzuu', 'ذُوْ', output_text)
-        output_text = re.sub(r'dzii', 'ذِيْ', output_text)
-        output_text = re.sub(r'dzaa', 'ذَا', output_text)
-        output_text = re.sub(r'dzuN', 'ذٌ', output_text)
-        output_text = re.sub(r'dziN', 'ذٍ', output_text)
-        output_text = re.sub(r'dzaN', 'ذً', output_text)
-        output_text = re.sub(r'ghuu', 'غُوْ', output_text)
-        output_text = re.sub(r'ghii', 'غِيْ', output_text)
-        output_text = re.sub(r'ghoo', 'غَا', output_text)
-        output_text = re.sub(r'ghuN', 'غٌ', output_text)
-        output_text = re.sub(r'ghiN', 'غٍ', output_text)
-        output_text = re.sub(r'ghaN', 'غً', output_text)
-        output_text = re.sub(r'khuu', 'حُوْ', output_text)
-        output_text = re.sub(r'khii', 'حِيْ', output_text)
-        output_text = re.sub(r'khaa', 'حَا', output_text)
-        output_text = re.sub(r'khuN', 'حٌ', output_text)
-        output_text = re.sub(r'khiN', 'حٍ', output_text)
-        output_text = re.sub(r'khaN', 'حً', output_text)
-        output_text = re.sub(r'shuu', 'صُوْ', output_text)
-        output_text = re.sub(r'shii', 'صِيْ', output_text)
-        output_text = re.sub(r'shoo', 'صَا', output_text)
-        output_text = re.sub(r'shuN', 'صٌ', output_text)
-        output_text = re.sub(r'shiN', 'صٍ', output_text)
-        output_text = re.sub(r'shaN', 'صً', output_text)
-        output_text = re.sub(r'syuu', 'شُوْ', output_text)
-        output_text = re.sub(r'syii', 'شِيْ', output_text)
-        output_text = re.sub(r'syaa', 'شَا', output_text)
-        output_text = re.sub(r'syuN', 'شٌ', output_text)
-        output_text = re.sub(r'syiN', 'شٍ', output_text)
-        output_text = re.sub(r'syaN', 'شً', output_text)
-        output_text = re.sub(r'thuu', 'طُوْ', output_text)
-        output_text = re.sub(r'thii', 'طِيْ', output_text)
-        output_text = re.sub(r'thoo', 'طَا', output_text)
-        output_text = re.sub(r'thuN', 'طٌ', output_text)
-        output_text = re.sub(r'thiN', 'طٍ', output_text)
-        output_text = re.sub(r'thon', 'طً', output_text)
-        output_text = re.sub(r'tsuu', 'ثُوْ', output_text)
-        output_text = re.sub(r'tsii', 'ثِيْ', output_text)
-        output_text = re.sub(r'tsaa', 'ثَا', output_text)
-        output_text = re.sub(r'tsuN', 'ثٌ', output_text)
-        output_text = re.sub(r'tsiN', 'ثٍ', output_text)
-        output_text = re.sub(r'tsaN', 'ثً', output_text)
-        output_text = re.sub(r'lloo', 'للّٰ', output_text)
-        output_text = re.sub(r'llo', 'للّٰ', output_text)
-        output_text = re.sub(r'tta', 'تَّ', output_text)
-        output_text = re.sub(r'ttu', 'تُّ', output_text)
-        output_text = re.sub(r'tti', 'تِّ', output_text)
-        output_text = re.sub(r'bbu', 'بُّ', output_text)
-        output_text = re.sub(r'bbi', 'بِّ', output_text)
-        output_text = re.sub(r'bba', 'بَّ', output_text)
-        output_text = re.sub(r'ddu', 'دُّ', output_text)
-        output_text = re.sub(r'ddi', 'دِّ', output_text)
-        output_text = re.sub(r'dda', 'دَّ', output_text)
-        output_text = re.sub(r'ffu', 'فُّ', output_text)
-        output_text = re.sub(r'ffi', 'فِّ', output_text)
-        output_text = re.sub(r'ffa', 'فَّ', output_text)
-        output_text = re.sub(r'hhu', 'هُّ', output_text)
-        output_text = re.sub(r'hhi', 'هِّ', output_text)
-        output_text = re.sub(r'hha', 'هَّ', output_text)
-        output_text = re.sub(r'jju', 'جُّ', output_text)
-        output_text = re.sub(r'jji', 'جِّ', output_text)
-        output_text = re.sub(r'jja', 'جَّ', output_text)
-        output_text = re.sub(r'kku', 'كُّ', output_text)
-        output_text = re.sub(r'kki', 'كِّ', output_text)
-        output_text = re.sub(r'kka', 'كَّ', output_text)
-        output_text = re.sub(r'llu', 'لُّ', output_text)
-        output_text = re.sub(r'lli', 'لِّ', output_text)
-        output_text = re.sub(r'lla', 'لَّ', output_text)
-        output_text = re.sub(r'mmu', 'مُّ', output_text)
-        output_text = re.sub(r'mmi', 'مِّ', output_text)
-        output_text = re.sub(r'mma', 'مَّ', output_text)
-        output_text = re.sub(r'nnu', 'نُّ', output_text)
-        output_text = re.sub(r'nni', 'نِّ', output_text)
-        output_text = re.sub(r'nna', 'نَّ', output_text)
-        output_text = re.sub(r'qqu', 'قُّ', output_text)
-        output_text = re.sub(r'qqi', 'قِّ', output_text)
-        output_text = re.sub(r'qqo', 'قَّ', output_text)
-        output_text = re.sub(r'rru', 'رُّ', output_text)
-        output_text = re.sub(r'rri', 'رِّ', output_text)
-        output_text = re.sub(r'rra', 'رَّ', output_text)
-        output_text = re.sub(r'ssu', 'سُّ', output_text)
-        output_text = re.sub(r'ssi', 'سِّ', output_text)
-        output_text = re.sub(r'ssa', 'سَّ', output_text)
-        output_text = re.sub(r'wwu', 'وُّ', output_text)
-        output_text = re.sub(r'wwi', 'وِّ', output_text)
-        output_text = re.sub(r'wwa', 'وَّ', output_text)
-        output_text = re.sub(r'yyu', 'يُّ', output_text)
-        output_text = re.sub(r'yyi', 'يِّ', output_text)
-        output_text = re.sub(r'yya', 'يَّ', output_text)
-        output_text = re.sub(r'zzu', 'زُّ', output_text)
-        output_text = re.sub(r'zzi', 'زِّ', output_text)
-        output_text = re.sub(r'zza', 'زَّ', output_text)
-        output_text = re.sub(r'\'\'u', 'عُّ', output_text)
-        output_text = re.sub(r'\'\'i', 'عِّ', output_text)
-        output_text = re.sub(r'\'\'a', 'عَّ', output_text)
-        output_text = re.sub(r'tuu', 'تُوْ', output_text)
-        output_text = re.sub(r'tii', 'تِيْ', output_text)
-        output_text = re.sub(r'taa', 'تَا', output_text)
-        output_text = re.sub(r'tuN', 'تٌ', output_text)
-        output_text = re.sub(r'tiN', 'تٍ', output_text)
-        output_text = re.sub(r'taN', 'تً', output_text)
-        output_text = re.sub(r'buu', 'بُوْ', output_text)
-        output_text = re.sub(r'bii', 'بِيْ', output_text)
-        output_text = re.sub(r'baa', 'بَا', output_text)
-        output_text = re.sub(r'buN', 'بٌ', output_text)
-        output_text = re.sub(r'biN', 'بٍ', output_text)
-        output_text = re.sub(r'baN', 'بً', output_text)
-        output_text = re.sub(r'duu', 'دُوْ', output_text)
-        output_text = re.sub(r'dii', 'دِيْ', output_text)
-        output_text = re.sub(r'daa', 'دَا', output_text)
-        output_text = re.sub(r'duN', 'دٌ', output_text)
-        output_text = re.sub(r'diN', 'دٍ', output_text)
-        output_text = re.sub(r'daN', 'دً', output_text)
-        output_text = re.sub(r'fuu', 'فُوْ', output_text)
-        output_text = re.sub(r'fii', 'فِيْ', output_text)
-        output_text = re.sub(r'faa', 'فَا', output_text)
-        output_text = re.sub(r'fuN', 'فٌ', output_text)
-        output_text = re.sub(r'fiN', 'فٍ', output_text)
-        output_text = re.sub(r'faN', 'فً', output_text)
-        output_text = re.sub(r'huu', 'هُوْ', output_text)
-        output_text = re.sub(r'hii', 'هِيْ', output_text)
-        output_text = re.sub(r'haa', 'هَا', output_text)
-        output_text = re.sub(r'huN', 'هٌ', output_text)
-        output_text = re.sub(r'hiN', 'هٍ', output_text)
-        output_text = re.sub(r'haN', 'هً', output_text)
-        output_text = re.sub(r'juu', 'جُوْ', output_text)
-        output_text = re.sub(r'jii', 'جِيْ', output_text)
-        output_text = re.sub(r'jaa', 'جَا', output_text)
-        output_text = re.sub(r'juN', 'جٌ', output_text)
-        output_text = re.sub(r'jiN', 'جٍ', output_text)
-        output_text = re.sub(r'jaN', 'جً', output_text)
-        output_text = re.sub(r'kuu', 'كُوْ', output_text)
-        output_text = re.sub(r'kii', 'كِيْ', output_text)
-        output_text = re.sub(r'kaa', 'كَا', output_text)
-        output_text = re.sub(r'kuN', 'كٌ', output_text)
-        output_text = re.sub(r'kiN', 'كٍ', output_text)
-        output_text = re.sub(r'kaN', 'كً', output_text)
-        output_text = re.sub(r'luu', 'لُوْ', output_text)
-        output_text = re.sub(r'lii', 'لِيْ', output_text)
-        output_text = re.sub(r'laa', 'لَا', output_text)
-        output_text = re.sub(r'luN', 'لٌ', output_text)
-        output_text = re.sub(r'liN', 'لٍ', output_text)
-        output_text = re.sub(r'laN', 'لً', output_text)
-        output_text = re.sub(r'muu', 'مُوْ', output_text)
-        output_text = re.sub(r'mii', 'مِيْ', output_text)
-        output_text = re.sub(r'maa', 'مَا', output_text)
-        output_text = re.sub(r'muN', 'مٌ', output_text)
-        output_text = re.sub(r'miN', 'مٍ', output_text)
-        output_text = re.sub(r'maN', 'مً', output_text)
-        output_text = re.sub(r'nuu', 'نُوْ', output_text)
-        output_text = re.sub(r'nii', 'نِيْ', output_text)
-        output_text = re.sub(r'naa', 'نَا', output_text)
-        output_text = re.sub(r'nuN', 'نٌ', output_text)
-        output_text = re.sub(r'niN', 'نٍ', output_text)
-        output_text = re.sub(r'naN', 'نً', output_text)
-        output_text = re.sub(r'quu', 'قُوْ', output_text)
-        output_text = re.sub(r'qii', 'قِيْ', output_text)
-        output_text = re.sub(r'qoo', 'قَا', output_text)
-        output_text = re.sub(r'quN', 'قٌ', output_text)
-        output_text = re.sub(r'qiN', 'قٍ', output_text)
-        output_text = re.sub(r'qon', 'قً', output_text)
-        output_text = re.sub(r'ruu', 'رُوْ', output_text)
-        output_text = re.sub(r'rii', 'رِيْ', output_text)
-        output_text = re.sub(r'roo', 'رَا', output_text)
-        output_text = re.sub(r'ruN', 'رٌ', output_text)
-        output_text = re.sub(r'riN', 'رٍ', output_text)
-        output_text = re.sub(r'ron', 'رً', output_text)
-        output_text = re.sub(r'suu', 'سُوْ', output_text)
-        output_text = re.sub(r'sii', 'سِيْ', output_text)
-        output_text = re.sub(r'saa', 'سَا', output_text)
-        output_text = re.sub(r'suN', 'سٌ', output_text)
-        output_text = re.sub(r'siN', 'سٍ', output_text)
-        output_text = re.sub(r'saN', 'سً', output_text)
-        output_text = re.sub(r'wuu', 'وُوْ', output_text)
-        output_text = re.sub(r'wii', 'وِيْ', output_text)
-        output_text = re.sub(r'waa', 'وَا', output_text)
-        output_text = re.sub(r'wuN', 'وٌ', output_text)
-        output_text = re.sub(r'wiN', 'وٍ', output_text)
-        output_text = re.sub(r'waN', 'وً', output_text)
-        output_text = re.sub(r'yuu', 'يُوْ', output_text)
-        output_text = re.sub(r'yii', 'يِيْ', output_text)
-        output_text = re.sub(r'yaa', 'يَا', output_text)
-        output_text = re.sub(r'yuN', 'يٌ', output_text)
-        output_text = re.sub(r'yiN', 'يٍ', output_text)
-        output_text = re.sub(r'yaN', 'يً', output_text)
-        output_text = re.sub(r'zuu', 'زُوْ', output_text)
-        output_text = re.sub(r'zii', 'زِيْ', output_text)
-        output_text = re.sub(r'zaa', 'زَا', output_text)
-        output_text = re.sub(r'zuN', 'زٌ', output_text)
-        output_text = re.sub(r'ziN', 'زٍ', output_text)
-        output_text = re.sub(r'zaN', 'زً', output_text)
-        output_text = re.sub(r'\'uu', 'عُوْ', output_text)
-        output_text = re.sub(r'\'ii', 'عِيْ', output_text)
-        output_text = re.sub(r'\'aa', 'عَا', output_text)
-        output_text = re.sub(r'\'uN', 'عٌ', output_text)
-        output_text = re.sub(r'\'iN', 'عٍ', output_text)
-        output_text = re.sub(r'\'aN', 'عً', output_text)
-        output_text = re.sub(r'chu', 'خُ', output_text)
-        output_text = re.sub(r'chi', 'خِ', output_text)
-        output_text = re.sub(r'cho', 'خَ', output_text)
-        output_text = re.sub(r'dhu', 'ظُ', output_text)
-        output_text = re.sub(r'dhi', 'ظِ', output_text)
-        output_text = re.sub(r'dho', 'ظَ', output_text)
-        output_text = re.sub(r'dlu', 'ضُ', output_text)
-        output_text = re.sub(r'dli', 'ضِ', output_text)
-        output_text = re.sub(r'dlo', 'ضَ', output_text)
-        output_text = re.sub(r'dzu', 'ذُ', output_text)
-        output_text = re.sub(r'dzi', 'ذِ', output_text)
-        output_text = re.sub(r'dza', 'ذَ', output_text)
-        output_text = re.sub(r'ghu', 'غُ', output_text)
-        output_text = re.sub(r'ghi', 'غِ', output_text)
-        output_text = re.sub(r'gho', 'غَ', output_text)
-        output_text = re.sub(r'khu', 'حُ', output_text)
-        output_text = re.sub(r'khi', 'حِ', output_text)
-        output_text = re.sub(r'kha', 'حَ', output_text)
-        output_text = re.sub(r'shu', 'صُ', output_text)
-        output_text = re.sub(r'shi', 'صِ', output_text)
-        output_text = re.sub(r'sho', 'صَ', output_text)
-        output_text = re.sub(r'syu', 'شُ', output_text)
-        output_text = re.sub(r'syi', 'شِ', output_text)
-        output_text = re.sub(r'sya', 'شَ', output_text)
-        output_text = re.sub(r'thu', 'طُ', output_text)
-        output_text = re.sub(r'thi', 'طِ', output_text)
-        output_text = re.sub(r'tho', 'طَ', output_text)
-        output_text = re.sub(r'tsu', 'ثُ', output_text)
-        output_text = re.sub(r'tsi', 'ثِ', output_text)
-        output_text = re.sub(r'tsa', 'ثَ', output_text)
-        output_text = re.sub(r'tu', 'تُ', output_text)
-        output_text = re.sub(r'ti', 'تِ', output_text)
-        output_text = re.sub(r'ta', 'تَ', output_text)
-        output_text = re.sub(r'bu', 'بُ', output_text)
-        output_text = re.sub(r'bi', 'بِ', output_text)
-        output_text = re.sub(r'ba', 'بَ', output_text)
-        output_text = re.sub(r'du', 'دُ', output_text)
-        output_text = re.sub(r'di', 'دِ', output_text)
-        output_text = re.sub(r'da', 'دَ', output_text)
-        output_text = re.sub(r'fu', 'فُ', output_text)
-        output_text = re.sub(r'fi', 'فِ', output_text)
-        output_text = re.sub(r'fa', 'فَ', output_text)
-        output_text = re.sub(r'hu', 'هُ', output_text)
-        output_text = re.sub(r'hi', 'هِ', output_text)
-        output_text = re.sub(r'ha', 'هَ', output_text)
-        output_text = re.sub(r'ju', 'جُ', output_text)
-        output_text = re.sub(r'ji', 'جِ', output_text)
-        output_text = re.sub(r'ja', 'جَ', output_text)
-        output_text = re.sub(r'ku', 'كُ', output_text)
-        output_text = re.sub(r'ki', 'كِ', output_text)
-        output_text = re.sub(r'ka', 'كَ', output_text)
-        output_text = re.sub(r'lu', 'لُ', output_text)
-        output_text = re.sub(r'li', 'لِ', output_text)
-        output_text = re.sub(r'la', 'لَ', output_text)
-        output_text = re.sub(r'mu', 'مُ', output_text)
-        output_text = re.sub(r'mi', 'مِ', output_text)
-        output_text = re.sub(r'ma', 'مَ', output_text)
-        output_text = re.sub(r'nu', 'نُ', output_text)
-        output_text = re.sub(r'ni', 'نِ', output_text)
-        output_text = re.sub(r'na', 'نَ', output_text)
-        output_text = re.sub(r'qu', 'قُ', output_text)
-        output_text = re.sub(r'qi', 'قِ', output_text)
-        output_text = re.sub(r'qo', 'قَ', output_text)
-        output_text = re.sub(r'ru', 'رُ', output_text)
-        output_text = re.sub(r'ri', 'رِ', output_text)
-        output_text = re.sub(r'ro', 'رَ', output_text)
-        output_text = re.sub(r'su', 'سُ', output_text)
-        output_text = re.sub(r'si', 'سِ', output_text)
-        output_text = re.sub(r'sa', 'سَ', output_text)
-        output_text = re.sub(r'wu', 'وُ', output_text)
-        output_text = re.sub(r'wi', 'وِ', output_text)
-        output_text = re.sub(r'wa', 'وَ', output_text)
-        output_text = re.sub(r'yu', 'يُ', output_text)
-        output_text = re.sub(r'yi', 'يِ', output_text)
-        output_text = re.sub(r'ya', 'يَ', output_text)
-        output_text = re.sub(r'zu', 'زُ', output_text)
-        output_text = re.sub(r'zi', 'زِ', output_text)
-        output_text = re.sub(r'za', 'زَ', output_text)
-        output_text = re.sub(r'\'u', 'عُ', output_text)
-        output_text = re.sub(r'\'i', 'عِ', output_text)
-        output_text = re.sub(r'\'a', 'عَ', output_text)
-        output_text = re.sub(r'ch', 'خْ', output_text)
-        output_text = re.sub(r'dh', 'ظْ', output_text)
-        output_text = re.sub(r'dl', 'ضْ', output_text)
-        output_text = re.sub(r'dz', 'ذْ', output_text)
-        output_text = re.sub(r'gh', 'غْ', output_text)
-        output_text = re.sub(r'kh', 'حْ', output_text)
-        output_text = re.sub(r'sh', 'صْ', output_text)
-        output_text = re.sub(r'sy', 'شْ', output_text)
-        output_text = re.sub(r'th', 'طْ', output_text)
-        output_text = re.sub(r'ts', 'ثْ', output_text)
-        output_text = re.sub(r't', 'تْ', output_text)
-        output_text = re.sub(r'b', 'بْ', output_text)
-        output_text = re.sub(r'd', 'دْ', output_text)
-        output_text = re.sub(r'f', 'فْ', output_text)
-        output_text = re.sub(r'h', 'هْ', output_text)
-        output_text = re.sub(r'j', 'جْ', output_text)
-        output_text = re.sub(r'k', 'كْ', output_text)
-        output_text = re.sub(r'l', 'لْ', output_text)
-        output_text = re.sub(r'm', 'مْ', output_text)
-        output_text = re.sub(r'n', 'نْ', output_text)
-        output_text = re.sub(r'q', 'قْ', output_text)
-        output_text = re.sub(r'r', 'رْ', output_text)
-        output_text = re.sub(r's', 'سْ', output_text)
-        output_text = re.sub(r'w', 'وْ', output_text)
-        output_text = re.sub(r'y', 'يْ', output_text)
-        output_text = re.sub(r'z', 'زْ', output_text)
-        output_text = re.sub(r'\'', 'عْ', output_text)
-        output_text = re.sub(r'AN', 'ءً', output_text)
-        output_text = re.sub(r'IN', 'ءٍ', output_text)
-        output_text = re.sub(r'UN', 'ءٌ', output_text)
-        output_text = re.sub(r'A', 'ءَ', output_text)
-        output_text = re.sub(r'I', 'ءِ', output_text)
-        output_text = re.sub(r'U', 'ءُ', output_text)
-        output_text = re.sub(r'aN', 'أً', output_text)
-        output_text = re.sub(r'iN', 'إٍ', output_text)
-        output_text = re.sub(r'uN', 'أٌ', output_text)
-        output_text = re.sub(r'a', 'أَ', output_text)
-        output_text = re.sub(r'i', 'إِ', output_text)
-        output_text = re.sub(r'u', 'أُ', output_text)
-        output_text = re.sub(r';', '', output_text)
-        output_text = re.sub(r'saw', 'ﷺ', output_text)
-        # Tampilkan hasil transliterasi
-        self.text_output.setPlainText(output_text)
-        self.text_output.verticalScrollBar().setValue(0)
+        diagnostics = []
+        output_text = self.cache.transliterate(self.engine, input_text, diagnostics)
+        del input_text
+        # Tampilkan hasil transliterasi; salinan Python dilepas begitu Qt
+        # memegang dokumennya
+        tab.set_output(output_text, True)
+        del output_text
+        self.show_cache_stats()
+        # Garis bawahi huruf Latin yang tidak punya aturan
+        tab.show_diagnostics(diagnostics, leading)
+
+    def transliterate_all(self):
+        # Tab aktif langsung, tab lain di latar belakang dengan prioritas rendah
+        for index in range(self.tabs.count()):
+            tab = self.tabs.widget(index)
+            if tab is not self.current:
+                self.queue_conversion(tab)
+        self.transliterate()
+
+    def show_cache_stats(self):
+        stats = self.cache.stats()
+        self.version_label.setToolTip("Cache hasil: %d hit / %d miss" % (stats["hits"], stats["misses"]))
 
     def copy_output(self):
         output_text = self.text_output.toPlainText()
@@ -890,10 +773,16 @@ class Transliterator(QWidget):
             notification.exec_()
 
     def reset_text(self):
-        self.text_input.clear()
-        self.text_output.clear()
+        self.current.reset()
         self.text_input.setFocus()
 
+    def closeEvent(self, event):
+        # Pekerjaan yang masih antre tidak perlu diselesaikan
+        for index in range(self.tabs.count()):
+            self.tabs.widget(index).cancel_job()
+        self.pool.waitForDone()
+        super().closeEvent(event)
+
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = Transliterator()
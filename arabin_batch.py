@@ -0,0 +1,371 @@
+# Transliterasi kolom data (daftar nama, nama tempat, dst.) dalam jumlah besar.
+#
+#   python arabin_batch.py siswa.csv --column nama -o siswa_arab.csv
+#   python arabin_batch.py tempat.parquet --column nama -o tempat_arab.parquet
+#
+# Satu kolom dikodekan menjadi satu buffer code point uint32 dan array offset.
+# Huruf yang hanya mungkin terkena aturan satu huruf (b -> بْ, A -> ءَ, ...)
+# diganti lewat tabel secara vektor; hanya rentang yang mungkin terkena aturan
+# multi-huruf yang dikirim ke RuleEngine biasa.
+#
+#   python arabin_batch.py siswa.csv --column nama --threads 8 -o siswa_arab.csv
+#
+# Dengan --threads, potongan nilai dibagi ke kumpulan thread yang memakai satu
+# RuleEngine bersama (mesin tidak pernah diubah setelah dibuat). Paralel
+# sungguhan hanya di CPython tanpa GIL (3.13t).
+#
+# Setiap potongan baris disimpan sebagai satu entri cache hasil (lihat
+# arabin_cache), kecuali dengan --no-cache.
+
+import argparse
+import csv
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from arabin_cache import ResultCache, CACHE_DIR, CACHE_SIZE
+from arabin_engine import load_engine
+
+# Batas entri cache rentang sebelum dikosongkan
+SPAN_CACHE_LIMIT = 200000
+
+# Pemisah nilai dalam satu entri cache potongan; tidak pernah ada di pola aturan
+SEPARATOR = "\0"
+
+
+def encode_column(values):
+    # Kembalikan (codes, offsets): code point semua nilai berurutan, dan
+    # offsets[i]:offsets[i + 1] adalah rentang nilai ke-i
+    lengths = np.fromiter((len(value) for value in values), dtype=np.int64, count=len(values))
+    offsets = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    codes = np.frombuffer("".join(values).encode("utf-32-le"), dtype=np.uint32)
+    return codes, offsets
+
+
+def decode_column(codes, offsets):
+    text = codes.astype(np.uint32, copy=False).tobytes().decode("utf-32-le")
+    bounds = offsets.tolist()
+    return [text[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+
+
+class ColumnTransliterator:
+    def __init__(self, engine):
+        self.engine = engine
+        self._spans = {}
+        self._build_tables()
+
+    def _build_tables(self):
+        # Tabel disusun sekali dari aturan mesin; mesin tidak pernah berubah,
+        # jadi aturan baru berarti mesin baru dan ColumnTransliterator baru
+        self._classes = None
+        if np is None:
+            return
+        rules = self.engine.rules()
+        letters = sorted({char for pattern, _ in rules for char in pattern})
+        if not letters:
+            # Tanpa aturan tidak ada yang diganti; cukup jalur per nilai
+            return
+        # Kelas 0 = karakter di luar alfabet pola
+        size = max(ord(char) for char in letters) + 1
+        self._classes = np.zeros(size, dtype=np.int32)
+        for index, char in enumerate(letters, 1):
+            self._classes[ord(char)] = index
+        count = len(letters) + 1
+
+        # Panjang pola terpanjang untuk setiap awalan dua huruf; 0 berarti
+        # tidak ada aturan multi-huruf yang bisa dimulai di situ
+        self._reach = np.zeros((count, count), dtype=np.int64)
+        single = {}
+        for pattern, replacement in rules:
+            if len(pattern) == 1:
+                single.setdefault(pattern, replacement)
+                continue
+            first, second = self._classes[ord(pattern[0])], self._classes[ord(pattern[1])]
+            self._reach[first, second] = max(self._reach[first, second], len(pattern))
+
+        # Tabel pengganti satu huruf: panjang hasil dan code point-nya
+        width = max([len(replacement) for replacement in single.values()] + [1])
+        self._out_length = np.ones(count, dtype=np.int64)
+        self._out_codes = np.zeros((count, width), dtype=np.uint32)
+        self._mapped = np.zeros(count, dtype=bool)
+        for char, replacement in single.items():
+            index = self._classes[ord(char)]
+            self._mapped[index] = True
+            self._out_length[index] = len(replacement)
+            self._out_codes[index, :len(replacement)] = [ord(c) for c in replacement]
+
+    def transliterate(self, values):
+        values = list(values)
+        if self._classes is None:
+            # Tanpa NumPy (atau tanpa aturan): tetap benar, hanya per nilai
+            return [self._convert_span(value) for value in values]
+        if len(self._spans) > SPAN_CACHE_LIMIT:
+            self._spans.clear()
+        codes, offsets = encode_column(values)
+        if not len(codes):
+            return values
+        classes = np.where(codes < len(self._classes),
+                           self._classes[np.minimum(codes, len(self._classes) - 1)], 0)
+
+        # Posisi awal yang mungkin memulai aturan multi-huruf, beserta
+        # jangkauannya (tidak melewati batas nilai)
+        row_end = np.repeat(offsets[1:], np.diff(offsets))
+        positions = np.arange(len(codes), dtype=np.int64)
+        reach = np.zeros(len(codes), dtype=np.int64)
+        reach[:-1] = self._reach[classes[:-1], classes[1:]]
+        ends = np.where(reach > 0, np.minimum(positions + reach, row_end), 0)
+
+        # Posisi tercakup jika ada awal sebelumnya yang jangkauannya melewatinya
+        cover = np.maximum.accumulate(ends)
+        covered = cover > positions
+        # Rentang = deret posisi tercakup yang bersambung, dipotong di batas nilai
+        joined = covered[:-1] & covered[1:] & (row_end[:-1] == row_end[1:])
+        span_starts = np.flatnonzero(covered & ~np.concatenate(([False], joined)))
+        span_ends = np.flatnonzero(covered & ~np.concatenate((joined, [False]))) + 1
+
+        # Panjang hasil tiap posisi: dari tabel, atau seluruh hasil rentang di
+        # posisi awal rentang (posisi lain di dalam rentang bernilai 0)
+        lengths = np.where(self._mapped[classes], self._out_length[classes], 1)
+        lengths[covered] = 0
+        span_outputs = []
+        if len(span_starts):
+            text = codes.tobytes().decode("utf-32-le")
+            for start, end in zip(span_starts.tolist(), span_ends.tolist()):
+                span_outputs.append(self._convert_span(text[start:end]))
+            lengths[span_starts] = [len(output) for output in span_outputs]
+
+        out_offsets = np.zeros(len(codes) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=out_offsets[1:])
+        out = np.empty(out_offsets[-1], dtype=np.uint32)
+
+        # Posisi bebas: salin karakter asli atau isi dari tabel pengganti
+        free = np.flatnonzero(~covered)
+        free_lengths = lengths[free]
+        slots = np.repeat(free, free_lengths)
+        within = np.arange(len(slots), dtype=np.int64) - np.repeat(np.cumsum(free_lengths) - free_lengths, free_lengths)
+        slot_classes = classes[slots]
+        out[out_offsets[slots] + within] = np.where(
+            self._mapped[slot_classes], self._out_codes[slot_classes, within], codes[slots])
+
+        # Hasil rentang dari mesin: disambung, dikodekan sekali, lalu disebar
+        if span_outputs:
+            span_lengths = lengths[span_starts]
+            span_codes = np.frombuffer("".join(span_outputs).encode("utf-32-le"), dtype=np.uint32)
+            within = np.arange(len(span_codes), dtype=np.int64) - np.repeat(np.cumsum(span_lengths) - span_lengths, span_lengths)
+            out[np.repeat(out_offsets[span_starts], span_lengths) + within] = span_codes
+        return decode_column(out, out_offsets[offsets])
+
+    def _convert_span(self, span):
+        output = self._spans.get(span)
+        if output is None:
+            output = self.engine.transliterate(span)
+            self._spans[span] = output
+        return output
+
+
+class ThreadedTransliterator:
+    def __init__(self, engine, threads=None, chunk_size=256):
+        self.engine = engine
+        self.chunk_size = chunk_size
+        self.threads = threads or os.cpu_count() or 1
+        self._pool = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="arabin")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def transliterate(self, values):
+        values = list(values)
+        chunks = [values[i:i + self.chunk_size] for i in range(0, len(values), self.chunk_size)]
+        results = []
+        for chunk in self._pool.map(self._convert_chunk, chunks):
+            results.extend(chunk)
+        return results
+
+    def _convert_chunk(self, chunk):
+        # Mesin dibaca saja, jadi tidak perlu kunci
+        transliterate = self.engine.transliterate
+        return [transliterate(value) for value in chunk]
+
+    def close(self):
+        self._pool.shutdown()
+
+
+def transliterate_parallel(engine, values, threads=None, chunk_size=256):
+    with ThreadedTransliterator(engine, threads, chunk_size) as converter:
+        return converter.transliterate(values)
+
+
+class CachedColumn:
+    # Satu potongan kolom = satu entri ResultCache. Nilai digabung dengan
+    # SEPARATOR yang tidak termasuk alfabet pola, jadi hasilnya sama persis
+    # dengan engine.transliterate atas teks gabungan itu.
+    def __init__(self, converter, cache):
+        self.converter = converter
+        self.cache = cache
+
+    def version(self):
+        return self.converter.engine.version()
+
+    def iter_transliterate(self, text, diagnostics=None):
+        # Dipanggil cache saat miss
+        yield SEPARATOR.join(self.converter.transliterate(text.split(SEPARATOR)))
+
+    def transliterate(self, values):
+        values = list(values)
+        if not values or any(SEPARATOR in value for value in values):
+            return self.converter.transliterate(values)
+        return self.cache.transliterate(self, SEPARATOR.join(values)).split(SEPARATOR)
+
+    def close(self):
+        close = getattr(self.converter, "close", None)
+        if close is not None:
+            close()
+
+
+# ===== CSV / PARQUET =====
+def transliterate_csv(source, target, column, converter, output_column=None, chunk_rows=65536):
+    # Dibaca dan ditulis per potongan, jadi berkas tidak pernah dimuat utuh
+    reader = csv.reader(source)
+    writer = csv.writer(target)
+    header = next(reader, None)
+    if header is None:
+        return 0
+    index = _column_index(header, column)
+    width = len(header)
+    if output_column:
+        header = header + [output_column]
+    writer.writerow(header)
+    total = 0
+    chunk = []
+    for row in reader:
+        chunk.append(row)
+        if len(chunk) >= chunk_rows:
+            total += _write_chunk(writer, chunk, index, width, converter, output_column)
+            chunk = []
+    if chunk:
+        total += _write_chunk(writer, chunk, index, width, converter, output_column)
+    return total
+
+
+def _column_index(header, column):
+    if column in header:
+        return header.index(column)
+    if column.isdigit() and int(column) < len(header):
+        return int(column)
+    raise ValueError("kolom %r tidak ditemukan (tersedia: %s)" % (column, ", ".join(header)))
+
+
+def _write_chunk(writer, chunk, index, width, converter, output_column):
+    values = [row[index] if index < len(row) else "" for row in chunk]
+    results = converter.transliterate(values)
+    for row, result in zip(chunk, results):
+        if output_column:
+            # Baris pendek diisi dulu agar hasil jatuh di kolom barunya
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+            row.append(result)
+        elif index < len(row):
+            row[index] = result
+    writer.writerows(chunk)
+    return len(chunk)
+
+
+def transliterate_parquet(source, target, column, converter, output_column=None, chunk_rows=65536):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("berkas Parquet membutuhkan paket pyarrow")
+    reader = pq.ParquetFile(source)
+    schema = reader.schema_arrow.remove_metadata()
+    index = _column_index(schema.names, column)
+    # Skema hasil disusun dari skema berkas, bukan dari potongan pertama, jadi
+    # berkas tanpa baris tetap menghasilkan berkas (kosong) dengan kolom yang benar
+    if output_column:
+        schema = schema.append(pa.field(output_column, pa.string()))
+    else:
+        schema = schema.set(index, pa.field(schema.names[index], pa.string()))
+    writer = pq.ParquetWriter(target, schema)
+    total = 0
+    try:
+        for batch in reader.iter_batches(batch_size=chunk_rows):
+            # Null tetap null di hasil; hanya nilai yang ada yang dikonversi
+            values = batch.column(index).to_pylist()
+            present = [value for value in values if value is not None]
+            converted = iter(converter.transliterate(present))
+            results = pa.array([None if value is None else next(converted) for value in values], type=pa.string())
+            arrays = list(batch.columns)
+            if output_column:
+                arrays.append(results)
+            else:
+                arrays[index] = results
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            total += batch.num_rows
+    finally:
+        writer.close()
+    return total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Transliterasi satu kolom CSV/Parquet")
+    parser.add_argument("source", help="berkas .csv atau .parquet ('-' = CSV dari stdin)")
+    parser.add_argument("--column", required=True, help="nama (atau nomor) kolom Latin")
+    parser.add_argument("-o", "--output", default="-", help="berkas hasil ('-' = stdout, hanya CSV)")
+    parser.add_argument("--output-column", help="tambahkan hasil sebagai kolom baru (default: ganti kolom)")
+    parser.add_argument("--chunk-rows", type=int, default=65536, help="jumlah baris per potongan")
+    parser.add_argument("--threads", type=int, help="konversi dengan N thread (tanpa NumPy)")
+    parser.add_argument("--no-overlays", action="store_true", help="abaikan aturan pengguna di ~/.arabin")
+    parser.add_argument("--no-cache", action="store_true", help="jangan pakai cache hasil di disk")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="folder cache hasil")
+    parser.add_argument("--cache-size", type=int, default=CACHE_SIZE // (1024 * 1024), help="batas cache dalam MB")
+    args = parser.parse_args(argv)
+
+    try:
+        engine = load_engine(not args.no_overlays)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.threads:
+        converter = ThreadedTransliterator(engine, args.threads)
+    else:
+        converter = ColumnTransliterator(engine)
+    if not args.no_cache:
+        converter = CachedColumn(converter, ResultCache(args.cache_dir, args.cache_size * 1024 * 1024))
+
+    try:
+        if args.source.endswith(".parquet"):
+            if args.output == "-":
+                parser.error("hasil Parquet harus ditulis ke berkas (-o)")
+            total = transliterate_parquet(args.source, args.output, args.column, converter,
+                                          args.output_column, args.chunk_rows)
+        else:
+            source = sys.stdin if args.source == "-" else open(args.source, encoding="utf-8", newline="")
+            target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+            try:
+                total = transliterate_csv(source, target, args.column, converter,
+                                          args.output_column, args.chunk_rows)
+            finally:
+                if source is not sys.stdin:
+                    source.close()
+                if target is not sys.stdout:
+                    target.close()
+    except (ValueError, RuntimeError) as e:
+        parser.error(str(e))
+    finally:
+        close = getattr(converter, "close", None)
+        if close is not None:
+            close()
+    print("%d baris" % total, file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
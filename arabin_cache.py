@@ -0,0 +1,253 @@
+# Cache hasil transliterasi di disk, dialamati isi: kuncinya hash dari
+# (versi tabel aturan, teks input apa adanya). Dokumen yang tidak berubah
+# cukup di-hash lalu dibaca kembali lewat mmap.
+
+import codecs
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import threading
+
+from arabin_engine import Diagnostic
+
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "arabin")
+CACHE_SIZE = 256 * 1024 * 1024
+
+# Setelah melewati batas, entri lama dibuang sampai ukuran turun ke sini
+EVICT_TARGET = 0.9
+
+# Ukuran potongan teks (karakter) saat menghitung kunci
+HASH_CHUNK = 1 << 16
+# Ukuran potongan (byte) saat membaca entri
+READ_CHUNK = 1 << 16
+
+
+class ResultCache:
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_SIZE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._total = None
+        # Satu cache dipakai bersama oleh beberapa thread (tab di latar belakang)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.bytes_read = 0
+
+    def transliterate(self, engine, text, diagnostics=None):
+        # Pengganti engine.transliterate: hasil dan diagnostiknya sama persis
+        # dengan tanpa cache. Diagnostik ikut disimpan jika diminta.
+        return "".join(self.iter_transliterate(engine, text, diagnostics))
+
+    def iter_transliterate(self, engine, text, diagnostics=None):
+        # Pengganti engine.iter_transliterate. Saat miss, setiap potongan hasil
+        # langsung ditulis ke berkas sementara, jadi tidak ada salinan UTF-8
+        # (atau JSON) dari seluruh hasil di memori.
+        # Kunci dari teks apa adanya (bukan NFC): bentuk Unicode yang berbeda
+        # menghasilkan konversi dan posisi diagnostik yang berbeda pula
+        kind = "diag" if diagnostics is not None else "text"
+        path = self._path(engine.version(), kind, text)
+        # Karakter hasil yang sudah diberikan dari entri sebelum ternyata rusak
+        skip = 0
+        chunks = self._read(path)
+        if chunks is not None:
+            with self._lock:
+                self.hits += 1
+            try:
+                if diagnostics is None:
+                    # Diteruskan per potongan: entri tidak pernah utuh di memori
+                    for chunk in chunks:
+                        yield chunk
+                        skip += len(chunk)
+                    return
+                stored = json.loads("".join(chunks))
+                diagnostics.extend(Diagnostic(*item) for item in stored["diagnostics"])
+                yield stored.pop("result")
+                return
+            except ValueError:
+                # Entri rusak: dianggap miss dan ditulis ulang. Hasil mesin
+                # selalu sama, jadi bagian yang sudah diberikan cukup dilewati.
+                with self._lock:
+                    self.hits -= 1
+            finally:
+                chunks.close()
+
+        with self._lock:
+            self.misses += 1
+        entry = self._open(path)
+        committed = False
+        try:
+            if diagnostics is not None:
+                entry = self._append(entry, '{"result": "')
+            for chunk in engine.iter_transliterate(text, diagnostics):
+                if diagnostics is None:
+                    entry = self._append(entry, chunk)
+                else:
+                    # Isi string JSON tanpa tanda kutipnya
+                    entry = self._append(entry, json.dumps(chunk, ensure_ascii=False)[1:-1])
+                if skip >= len(chunk):
+                    skip -= len(chunk)
+                    continue
+                yield chunk[skip:]
+                skip = 0
+            if diagnostics is not None:
+                entry = self._append(entry, '", "diagnostics": %s}' % json.dumps(diagnostics, ensure_ascii=False))
+            committed = self._commit(entry, path)
+        finally:
+            # Konversi gagal atau tidak dibaca sampai habis: entri dibuang
+            if not committed:
+                self._discard(entry)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "bytes_read": self.bytes_read,
+        }
+
+    def _path(self, version, kind, text):
+        digest = hashlib.sha256()
+        digest.update(("%s\0%s\0" % (version, kind)).encode("ascii"))
+        # Di-hash per potongan agar teks tidak pernah dikodekan utuh sekaligus
+        for start in range(0, len(text), HASH_CHUNK):
+            digest.update(text[start:start + HASH_CHUNK].encode("utf-8", "surrogatepass"))
+        key = digest.hexdigest()
+        return os.path.join(self.directory, key[:2], key[2:])
+
+    def _read(self, path):
+        # Generator potongan isi entri, atau None jika tidak ada. Isi berkas
+        # yang rusak baru ketahuan saat dibaca (ValueError dari generator).
+        try:
+            f = open(path, "rb")
+        except OSError:
+            return None
+        try:
+            size = os.fstat(f.fileno()).st_size
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+            # Waktu akses untuk LRU
+            os.utime(path)
+        except (OSError, ValueError):
+            f.close()
+            return None
+        return self._decode(f, mapped, size)
+
+    def _decode(self, f, mapped, size):
+        # Didekode per potongan langsung dari halaman yang dipetakan, dan
+        # setiap potongan diberikan sebelum yang berikutnya dibaca
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        try:
+            for start in range(0, size, READ_CHUNK):
+                chunk = decoder.decode(mapped[start:start + READ_CHUNK], start + READ_CHUNK >= size)
+                with self._lock:
+                    self.bytes_read += min(READ_CHUNK, size - start)
+                if chunk:
+                    yield chunk
+        finally:
+            if mapped is not None:
+                mapped.close()
+            f.close()
+
+    # Cache hanya pelengkap: gagal menulis tidak boleh menggagalkan konversi.
+    # Entri yang sedang ditulis berupa (berkas, path sementara), None jika gagal.
+    def _open(self, path):
+        folder = os.path.dirname(path)
+        try:
+            os.makedirs(folder, exist_ok=True)
+            handle, temp = tempfile.mkstemp(dir=folder, prefix=".tmp-")
+        except OSError:
+            return None
+        return os.fdopen(handle, "w", encoding="utf-8", newline=""), temp
+
+    def _append(self, entry, text):
+        if entry is None:
+            return None
+        try:
+            entry[0].write(text)
+        except (OSError, ValueError):
+            # ValueError: surrogate tunggal tidak bisa ditulis sebagai UTF-8
+            self._discard(entry)
+            return None
+        return entry
+
+    def _commit(self, entry, path):
+        if entry is None:
+            return False
+        f, temp = entry
+        try:
+            f.close()
+            size = os.path.getsize(temp)
+            os.replace(temp, path)
+        except OSError:
+            return False
+        with self._lock:
+            self.stores += 1
+            if self._total is None:
+                self._total = sum(size for _, size, _ in self._entries())
+            else:
+                self._total += size
+            if self._total > self.max_bytes:
+                self._evict()
+        return True
+
+    def _discard(self, entry):
+        if entry is None:
+            return
+        f, temp = entry
+        try:
+            f.close()
+        except OSError:
+            pass
+        try:
+            os.remove(temp)
+        except OSError:
+            pass
+
+    def _entries(self):
+        try:
+            folders = list(os.scandir(self.directory))
+        except OSError:
+            return
+        for folder in folders:
+            if not folder.is_dir():
+                continue
+            for entry in os.scandir(folder.path):
+                if entry.name.startswith(".tmp-"):
+                    continue
+                try:
+                    info = entry.stat()
+                except OSError:
+                    continue
+                yield entry.path, info.st_size, info.st_mtime
+
+    def _evict(self):
+        # Buang yang paling lama tidak dipakai sampai di bawah target
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICT_TARGET
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+        self._total = total
+
+    def clear(self):
+        for path, _, _ in list(self._entries()):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        with self._lock:
+            self._total = 0
@@ -0,0 +1,112 @@
+# Transliterasi dari baris perintah, tanpa jendela.
+#
+#   python arabin_cli.py teks.txt                  -> hasil ke stdout
+#   echo "bismi --llohi" | python arabin_cli.py    -> baca dari stdin
+#   python arabin_cli.py bab1.txt bab2.txt -d hasil --report laporan.json
+
+import argparse
+import bisect
+import json
+import os
+import sys
+
+from arabin_cache import ResultCache, CACHE_DIR, CACHE_SIZE
+from arabin_engine import load_engine
+
+
+def locate(text, diagnostics):
+    # Ubah posisi karakter menjadi baris/kolom (mulai dari 1) untuk laporan
+    newlines = [index for index, char in enumerate(text) if char == "\n"]
+    items = []
+    for diagnostic in diagnostics:
+        line = bisect.bisect_left(newlines, diagnostic.start)
+        column = diagnostic.start - (newlines[line - 1] + 1 if line else 0)
+        items.append({
+            "line": line + 1,
+            "column": column + 1,
+            "start": diagnostic.start,
+            "end": diagnostic.end,
+            "text": diagnostic.text,
+        })
+    return items
+
+
+def output_path(path, directory):
+    name = os.path.splitext(os.path.basename(path))[0] + ".arab.txt"
+    return os.path.join(directory, name)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Transliterasi teks Latin ke huruf Arab")
+    parser.add_argument("files", nargs="*", help="berkas input (kosong = stdin)")
+    parser.add_argument("-d", "--output-dir", help="folder hasil untuk banyak berkas (nama.arab.txt)")
+    parser.add_argument("--overlay", action="append", help="berkas aturan tambahan (boleh berulang)")
+    parser.add_argument("--no-overlays", action="store_true", help="abaikan aturan pengguna di ~/.arabin")
+    parser.add_argument("--report", help="tulis laporan huruf tak terpetakan (JSON) ke berkas, '-' untuk stderr")
+    parser.add_argument("--strict", action="store_true", help="keluar dengan kode 2 jika ada huruf tak terpetakan")
+    parser.add_argument("--no-cache", action="store_true", help="jangan pakai cache hasil di disk")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="folder cache hasil")
+    parser.add_argument("--cache-size", type=int, default=CACHE_SIZE // (1024 * 1024), help="batas cache dalam MB")
+    parser.add_argument("--cache-stats", action="store_true", help="tampilkan statistik cache ke stderr")
+    args = parser.parse_args(argv)
+
+    if len(args.files) > 1 and not args.output_dir:
+        parser.error("untuk lebih dari satu berkas, gunakan --output-dir")
+
+    try:
+        engine = load_engine(not args.no_overlays, args.overlay or [])
+    except ValueError as e:
+        parser.error(str(e))
+
+    cache = None if args.no_cache else ResultCache(args.cache_dir, args.cache_size * 1024 * 1024)
+
+    # Diagnostik hanya dikumpulkan jika memang diminta
+    collect = args.report is not None or args.strict
+    report = {"files": [], "total": 0}
+
+    sources = args.files or ["-"]
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    for path in sources:
+        if path == "-":
+            text = sys.stdin.read()
+        else:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+
+        diagnostics = [] if collect else None
+        if cache is not None:
+            chunks = cache.iter_transliterate(engine, text, diagnostics)
+        else:
+            chunks = engine.iter_transliterate(text, diagnostics)
+
+        # Hasil ditulis per potongan, tidak pernah utuh di memori
+        if args.output_dir and path != "-":
+            with open(output_path(path, args.output_dir), "w", encoding="utf-8") as f:
+                f.writelines(chunks)
+        else:
+            sys.stdout.writelines(chunks)
+
+        if collect:
+            items = locate(text, diagnostics)
+            report["files"].append({"path": path, "diagnostics": items})
+            report["total"] += len(items)
+
+    if args.report:
+        text = json.dumps(report, ensure_ascii=False, indent=2) + "\n"
+        if args.report == "-":
+            sys.stderr.write(text)
+        else:
+            with open(args.report, "w", encoding="utf-8") as f:
+                f.write(text)
+
+    if args.cache_stats and cache is not None:
+        print("cache: " + json.dumps(cache.stats()), file=sys.stderr)
+
+    if args.strict and report["total"]:
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,528 @@
+import functools
+import hashlib
+import os
+import re
+from collections import namedtuple
+
+# Folder aturan pengguna: setiap berkas *.txt di sini menjadi satu lapisan
+# overlay di atas tabel dasar (urut nama berkas, yang belakangan menang).
+OVERLAY_DIR = os.path.join(os.path.expanduser("~"), ".arabin")
+
+# Prioritas disimpan sebagai bilangan bulat: indeks aturan dasar digeser
+# PRIORITY_SHIFT bit, sehingga aturan overlay bisa disisipkan tepat sebelum
+# aturan dasar mana pun. Setiap lapisan overlay diberi jarak LAYER_STRIDE.
+PRIORITY_SHIFT = 32
+LAYER_STRIDE = 1 << 20
+
+# Ukuran potongan hasil (karakter input) pada iter_transliterate
+CHUNK_SIZE = 16384
+
+# Hasil per segmen yang diingat mesin: paling banyak MEMO_SIZE segmen, masing-
+# masing paling panjang MEMO_SEGMENT karakter (kata biasa, bukan deretan huruf
+# tanpa spasi)
+MEMO_SIZE = 32768
+MEMO_SEGMENT = 64
+
+# Huruf Latin yang lolos ke hasil karena tidak ada aturan yang memakainya
+Diagnostic = namedtuple("Diagnostic", "start end text")
+LATIN_RE = re.compile("[A-Za-z]+")
+
+
+def parse_rule_file(path):
+    # Format satu aturan per baris: "pola = hasil". Baris kosong dan baris
+    # yang diawali "#" diabaikan. Hasil boleh kosong (seperti aturan ";").
+    rules = []
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if "=" not in line:
+                raise ValueError("%s:%d: aturan harus berbentuk 'pola = hasil'" % (path, number))
+            pattern, replacement = line.split("=", 1)
+            pattern = pattern.strip()
+            if not pattern:
+                raise ValueError("%s:%d: pola tidak boleh kosong" % (path, number))
+            rules.append((pattern, replacement.strip()))
+    return rules
+
+
+def overlay_files(directory=OVERLAY_DIR):
+    if not os.path.isdir(directory):
+        return []
+    names = sorted(name for name in os.listdir(directory) if name.endswith(".txt"))
+    return [os.path.join(directory, name) for name in names]
+
+
+def load_engine(overlays=True, extra=()):
+    # Mesin dasar + aturan pengguna di OVERLAY_DIR (urut nama berkas), lalu
+    # berkas tambahan. Berkas yang tidak bisa dibaca atau salah format
+    # dilaporkan sebagai satu ValueError, siap untuk parser.error().
+    engine = RuleEngine()
+    for path in (overlay_files() if overlays else []) + list(extra):
+        try:
+            engine = engine.with_overlay_file(path)
+        except UnicodeDecodeError as e:
+            raise ValueError("aturan pengguna tidak bisa dimuat: %s: %s" % (path, e)) from e
+        except (OSError, ValueError) as e:
+            raise ValueError("aturan pengguna tidak bisa dimuat: %s" % e) from e
+    return engine
+
+
+class RuleEngine:
+    # Mesin transliterasi satu lintasan. Hasilnya sama dengan menjalankan
+    # re.sub untuk setiap aturan secara berurutan: aturan yang lebih awal
+    # (prioritas lebih kecil) selalu menang, di mana pun letaknya dalam kata.
+    #
+    # Semua pola berupa huruf Latin dan hasilnya huruf Arab, jadi aturan yang
+    # belakangan hanya bisa cocok pada sisa huruf Latin yang belum terpakai.
+    # Karakter di luar alfabet pola (spasi, angka, dst.) tidak pernah ikut
+    # dalam pola mana pun, sehingga teks bisa diproses per segmen.
+    #
+    # Objek mesin tidak pernah diubah setelah dibuat, jadi satu mesin aman
+    # dipakai bersama oleh banyak thread tanpa kunci. Menambah atau mengganti
+    # overlay menghasilkan mesin baru yang berbagi cabang trie yang tidak
+    # berubah; mesin lama tetap utuh untuk thread yang masih memakainya.
+    # Satu-satunya yang berubah adalah memo hasil per segmen, dan itu hanya
+    # cache: isinya selalu sama dengan menghitung ulang, jadi thread yang
+    # berebut paling buruk menghitung segmen yang sama dua kali.
+
+    def __init__(self, rules=None):
+        # Tabel dasar dikompilasi sekali per proses lalu dipakai bersama oleh
+        # semua RuleEngine(); aman karena tidak ada mesin yang mengubahnya
+        compiled = _compiled_base() if rules is None else _compile_rules(rules)
+        self._base, self._trie, self._letters, self._segment_re = compiled
+        self._overlays = {}
+        self._overlay_rules = {}
+        self._version = None
+        self._memo = {}
+
+    # ===== OVERLAY =====
+    def with_overlay(self, name, rules):
+        overlays = dict(self._overlays)
+        overlays[name] = tuple(rules)
+        return self._derive(overlays)
+
+    def without_overlay(self, name):
+        overlays = dict(self._overlays)
+        overlays.pop(name, None)
+        return self._derive(overlays)
+
+    def with_overlay_file(self, path):
+        return self.with_overlay(path, parse_rule_file(path))
+
+    def overlays(self):
+        return list(self._overlays)
+
+    def rules(self):
+        # Aturan yang berlaku saat ini (dasar + overlay), urut prioritas
+        merged = dict(self._base)
+        merged.update(self._overlay_rules)
+        ordered = sorted(merged.items(), key=lambda item: item[1][0])
+        return [(pattern, entry[1]) for pattern, entry in ordered]
+
+    def version(self):
+        # Sidik jari tabel aturan yang berlaku, dipakai sebagai bagian kunci
+        # cache. Dihitung sekali saat pertama diminta; hasilnya selalu sama,
+        # jadi dua thread yang menghitung bersamaan tidak masalah.
+        if self._version is None:
+            digest = hashlib.sha256()
+            for pattern, replacement in self.rules():
+                digest.update(("%s\0%s\0" % (pattern, replacement)).encode("utf-8"))
+            self._version = digest.hexdigest()[:16]
+        return self._version
+
+    def _overlay_entries(self, overlays):
+        # Aturan overlay disisipkan tepat sebelum aturan dasar paling awal yang
+        # polanya sama atau menjadi bagian dari polanya, jadi "saw" menang atas
+        # "sa" dan "s", sedangkan "a" tetap di posisi "a" sehingga "ba" tidak
+        # terganggu. Di titik sisip yang sama, lapisan yang belakangan menang,
+        # lalu urutan baris di dalam berkas.
+        base = self._base
+        rules = {}
+        for layer, layer_rules in enumerate(overlays.values()):
+            for index, (pattern, replacement) in enumerate(layer_rules):
+                anchor = len(base) << PRIORITY_SHIFT
+                for start in range(len(pattern)):
+                    for end in range(start + 1, len(pattern) + 1):
+                        entry = base.get(pattern[start:end])
+                        if entry is not None and entry[0] < anchor:
+                            anchor = entry[0]
+                rules[pattern] = (anchor - (layer + 1) * LAYER_STRIDE + index, replacement)
+        return rules
+
+    def _derive(self, overlays):
+        # Hanya pola yang disebut overlay (lama atau baru) yang mungkin berubah,
+        # dan hanya jalur trie milik pola itu yang disalin untuk mesin baru.
+        engine = object.__new__(RuleEngine)
+        engine._base = base = self._base
+        engine._overlays = overlays
+        engine._overlay_rules = overlay_rules = self._overlay_entries(overlays)
+        engine._version = None
+        engine._memo = {}
+        old = self._overlay_rules
+        trie = self._trie
+        letters = self._letters
+        fresh = set()
+        for pattern in old.keys() | overlay_rules.keys():
+            before = old.get(pattern) or base.get(pattern)
+            after = overlay_rules.get(pattern) or base.get(pattern)
+            if before == after:
+                continue
+            trie = _trie_set(trie, pattern, after, fresh)
+            if before is None or after is None:
+                if letters is self._letters:
+                    letters = dict(letters)
+                _count_letters(letters, pattern, 1 if before is None else -1)
+        engine._trie = trie
+        engine._letters = letters
+        if letters.keys() == self._letters.keys():
+            engine._segment_re = self._segment_re
+        else:
+            engine._segment_re = _compile_segments(letters)
+        return engine
+
+    # ===== TRANSLITERASI =====
+    def transliterate(self, text, diagnostics=None):
+        # Jika diagnostics berupa list, huruf Latin yang tidak terpakai aturan
+        # mana pun dicatat ke dalamnya sebagai Diagnostic (posisi dalam text).
+        # Dengan None tidak ada pemeriksaan tambahan sama sekali.
+        return "".join(self.iter_transliterate(text, diagnostics))
+
+    def iter_transliterate(self, text, diagnostics=None, chunk_size=CHUNK_SIZE):
+        # Hasil dikeluarkan per potongan (kira-kira chunk_size karakter input).
+        # Hasil per kata langsung digabung ke potongannya, jadi yang tertahan
+        # di memori hanya input, potongan hasil, dan satu daftar kecil.
+        if self._segment_re is None:
+            if diagnostics is not None:
+                _report_gap(diagnostics, text, 0, len(text))
+            yield text
+            return
+        pieces = []
+        position = 0
+        flushed = 0
+        for match in self._segment_re.finditer(text):
+            start, end = match.span()
+            if start > position:
+                pieces.append(text[position:start])
+                if diagnostics is not None:
+                    _report_gap(diagnostics, text, position, start)
+            pieces.append(self._convert_segment(match.group(), start, diagnostics))
+            position = end
+            if position - flushed >= chunk_size:
+                yield "".join(pieces)
+                pieces.clear()
+                flushed = position
+        pieces.append(text[position:])
+        if diagnostics is not None:
+            _report_gap(diagnostics, text, position, len(text))
+        yield "".join(pieces)
+
+    def _convert_segment(self, segment, offset=0, diagnostics=None):
+        # Teks biasa mengulang kata yang sama berkali-kali, dan segmen yang
+        # sama selalu menghasilkan hasil dan huruf tak terpetakan yang sama
+        memo = self._memo
+        known = memo.get(segment)
+        if known is None:
+            known = self._resolve(segment)
+            if len(segment) <= MEMO_SEGMENT:
+                if len(memo) >= MEMO_SIZE:
+                    memo.clear()
+                memo[segment] = known
+        output, gaps = known
+        if diagnostics is not None:
+            for index, text in gaps:
+                _add_diagnostic(diagnostics, offset + index, text)
+        return output
+
+    def _resolve(self, segment):
+        # (hasil, huruf Latin yang tidak terpakai beserta posisinya di segmen)
+        trie = self._trie
+        length = len(segment)
+        matches = []
+        for start in range(length):
+            node = trie
+            for end in range(start, length):
+                node = node.get(segment[end])
+                if node is None:
+                    break
+                entry = node.get("")
+                if entry is not None:
+                    matches.append((entry[0], start, end + 1, entry[1]))
+        if not matches:
+            return segment, tuple((match.start(), match.group()) for match in LATIN_RE.finditer(segment))
+        # Urutkan menurut prioritas aturan, lalu posisi (kiri ke kanan) seperti
+        # re.sub: kecocokan satu aturan tidak saling tumpang tindih dan tidak
+        # boleh menyentuh huruf yang sudah dipakai aturan sebelumnya.
+        matches.sort()
+        # Huruf yang sudah dipakai, satu bit per posisi
+        used = 0
+        taken = [None] * length
+        current = None
+        last_end = 0
+        for priority, start, end, replacement in matches:
+            if priority != current:
+                current = priority
+                last_end = 0
+            mask = ((1 << (end - start)) - 1) << start
+            if start < last_end or used & mask:
+                continue
+            used |= mask
+            taken[start] = (end, replacement)
+            last_end = end
+        pieces = []
+        gaps = []
+        index = 0
+        while index < length:
+            hit = taken[index]
+            if hit is None:
+                char = segment[index]
+                pieces.append(char)
+                if char.isascii() and char.isalpha():
+                    gaps.append((index, char))
+                index += 1
+            else:
+                pieces.append(hit[1])
+                index = hit[0]
+        return "".join(pieces), tuple(gaps)
+
+
+class Composer:
+    # Mode ketik langsung (seperti IME): huruf Arab dikirim begitu sebuah
+    # aturan sudah pasti. Statusnya adalah simpul trie milik RuleEngine, jadi
+    # setiap ketukan hanya satu langkah di trie dan dokumen tidak pernah
+    # dipindai ulang. Misalnya setelah "dd" masih menunggu karena "z", "h",
+    # "l" atau harakat bisa menyusul.
+    #
+    # Berbeda dengan transliterate() yang memakai urutan prioritas tabel,
+    # di sini yang dipakai adalah pola terpanjang dari kiri, karena huruf
+    # yang sudah dikirim tidak bisa ditarik kembali.
+
+    def __init__(self, engine):
+        self._engine = engine
+        self.reset()
+
+    def reset(self):
+        self._node = self._engine._trie
+        self._last = None
+        self.pending = ""
+
+    def feed(self, char):
+        # Kembalikan teks Arab yang sudah pasti; sisa komposisi ada di pending
+        out = []
+        self._step(char, out)
+        return "".join(out)
+
+    def flush(self):
+        out = []
+        while self.pending:
+            rest = self._commit_longest(out)
+            for char in rest:
+                self._step(char, out)
+        return "".join(out)
+
+    def backspace(self):
+        # Hapus satu huruf dari komposisi dan telusuri ulang dari akar;
+        # panjangnya dibatasi pola terpanjang, jadi tetap konstan.
+        pending = self.pending[:-1]
+        self.reset()
+        out = []
+        for char in pending:
+            self._step(char, out)
+        return "".join(out)
+
+    def _step(self, char, out):
+        child = self._node.get(char)
+        if child is not None:
+            self._node = child
+            self.pending += char
+            entry = child.get("")
+            if entry is not None:
+                self._last = (len(self.pending), entry[1])
+            if child.keys() <= {""}:
+                # Tidak ada pola yang lebih panjang, langsung kirim
+                self._commit_longest(out)
+            return
+        if not self.pending:
+            # Huruf ini tidak memulai pola apa pun
+            out.append(char)
+            return
+        rest = self._commit_longest(out)
+        for pending_char in rest + char:
+            self._step(pending_char, out)
+
+    def _commit_longest(self, out):
+        if self._last is not None:
+            length, replacement = self._last
+            out.append(replacement)
+        else:
+            length = 1
+            out.append(self.pending[0])
+        rest = self.pending[length:]
+        self.reset()
+        return rest
+
+
+def _compile_rules(rules):
+    base = {}
+    for index, (pattern, replacement) in enumerate(rules):
+        # Pola ganda: yang pertama sudah memakan semua kemunculannya
+        base.setdefault(pattern, (index << PRIORITY_SHIFT, replacement))
+    trie = {}
+    letters = {}
+    fresh = set()
+    for pattern, entry in base.items():
+        trie = _trie_set(trie, pattern, entry, fresh)
+        _count_letters(letters, pattern, 1)
+    return base, trie, letters, _compile_segments(letters)
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_base():
+    # Baru dibangkitkan saat RuleEngine() pertama dibuat
+    return _compile_rules(base_rules())
+
+
+def _trie_set(root, pattern, entry, fresh):
+    # Pasang (atau hapus, jika entry None) penanda akhir pola dan kembalikan
+    # akar trie baru. Simpul di sepanjang jalur disalin kecuali sudah dibuat
+    # dalam penurunan yang sama (dicatat di fresh), jadi trie lama tidak
+    # pernah diubah.
+    if id(root) not in fresh:
+        root = dict(root)
+        fresh.add(id(root))
+    path = [root]
+    for char in pattern:
+        child = path[-1].get(char)
+        if child is None:
+            child = {}
+        elif id(child) not in fresh:
+            child = dict(child)
+        fresh.add(id(child))
+        path[-1][char] = child
+        path.append(child)
+    if entry is not None:
+        # Kunci "" menandai akhir pola (bukan karakter yang mungkin muncul)
+        path[-1][""] = entry
+        return root
+    path[-1].pop("", None)
+    # Pangkas simpul yang sudah tidak dipakai pola lain
+    for depth in range(len(pattern), 0, -1):
+        if path[depth]:
+            break
+        del path[depth - 1][pattern[depth - 1]]
+    return root
+
+
+def _count_letters(letters, pattern, delta):
+    for char in set(pattern):
+        count = letters.get(char, 0) + delta
+        if count:
+            letters[char] = count
+        else:
+            del letters[char]
+
+
+def _compile_segments(letters):
+    # Pola segmen disimpan di mesin, jadi tidak bergantung pada cache global re
+    alphabet = "".join(sorted(letters))
+    return re.compile("[%s]+" % re.escape(alphabet)) if alphabet else None
+
+
+def _report_gap(diagnostics, text, start, end, offset=0):
+    # Di luar segmen tidak ada aturan yang berlaku, jadi semua huruf Latin lolos
+    for match in LATIN_RE.finditer(text, start, end):
+        _add_diagnostic(diagnostics, offset + match.start(), match.group())
+
+
+def _add_diagnostic(diagnostics, position, text):
+    # Huruf yang bersebelahan digabung menjadi satu rentang
+    if diagnostics and diagnostics[-1].end == position:
+        last = diagnostics[-1]
+        diagnostics[-1] = Diagnostic(last.start, position + len(text), last.text + text)
+    else:
+        diagnostics.append(Diagnostic(position, position + len(text), text))
+
+
+# ===== TATA BAHASA ATURAN =====
+# Tabel dasar tidak ditulis satu per satu, tetapi dibangkitkan dari daftar
+# konsonan x bentuk vokal (pendek, panjang, tanwin) x syaddah, ditambah
+# daftar pengecualian. Urutan tingkatan di base_rules() adalah prioritasnya.
+
+FATHA, KASRA, DAMMA = "\u064e", "\u0650", "\u064f"
+FATHATAN, KASRATAN, DAMMATAN = "\u064b", "\u064d", "\u064c"
+SHADDA, SUKUN = "\u0651", "\u0652"
+ALIF, WAW, YA = "ا", "و", "ي"
+
+# (Latin, Arab, huruf fathah). Sebagian konsonan ditulis dengan "o" untuk
+# fathah, misalnya "cho" -> خَ dan "roo" -> رَا.
+DIGRAPHS = [
+    ("ch", "خ", "o"), ("dh", "ظ", "o"), ("dl", "ض", "o"), ("dz", "ذ", "a"), ("gh", "غ", "o"),
+    ("kh", "ح", "a"), ("sh", "ص", "o"), ("sy", "ش", "a"), ("th", "ط", "o"), ("ts", "ث", "a"),
+]
+LETTERS = [
+    ("t", "ت", "a"), ("b", "ب", "a"), ("d", "د", "a"), ("f", "ف", "a"), ("h", "ه", "a"),
+    ("j", "ج", "a"), ("k", "ك", "a"), ("l", "ل", "a"), ("m", "م", "a"), ("n", "ن", "a"),
+    ("q", "ق", "o"), ("r", "ر", "o"), ("s", "س", "a"), ("w", "و", "a"), ("y", "ي", "a"),
+    ("z", "ز", "a"), ("'", "ع", "a"),
+]
+
+# Akhiran Latin ({a} = huruf fathah konsonan) dan tanda yang ditambahkan
+TANWIN = [("uN", DAMMATAN), ("iN", KASRATAN), ("{a}N", FATHATAN)]
+SHORT = [("u", DAMMA), ("i", KASRA), ("{a}", FATHA)]
+LONG = [("uu", DAMMA + WAW + SUKUN), ("ii", KASRA + YA + SUKUN), ("{a}{a}", FATHA + ALIF)] + TANWIN
+
+# Pola yang sejak awal ditulis berbeda dari bentuk bakunya. Dipertahankan
+# agar hasil transliterasi tidak berubah; cukup ubah di sini untuk merapikan.
+EXCEPTIONS = {
+    "cchoN": "cchaN", "ddhoN": "ddhaN", "ddloN": "ddlaN", "sshoN": "sshaN", "rroN": "rron",
+    "qqoo": "qqo",
+    "ccho": "ccha", "ddho": "ddha", "ddlo": "ddla", "ggho": "ggha", "ssho": "ssha", "rro": "rra",
+    "choN": "chaN", "dhoN": "dhaN", "dloN": "dlaN", "ghoN": "ghaN", "shoN": "shaN", "thoN": "thon",
+    "qoN": "qon", "roN": "ron",
+}
+
+# Aturan husus di luar pola konsonan + vokal
+SPECIAL = [
+    ("'alaa", "عَلٰى"),
+    ("dzaalika", "ذٰلِكَ"),
+    ("--", "ال"),
+    ("-", "ا"),
+]
+ALLAH = [
+    ("lloo", "للّٰ"),
+    ("llo", "للّٰ"),
+]
+
+
+def _forms(consonants, endings, doubled=False):
+    for latin, arabic, fatha in consonants:
+        head = latin[0] + latin if doubled else latin
+        letter = arabic + SHADDA if doubled else arabic
+        for ending, marks in endings:
+            pattern = head + ending.format(a=fatha)
+            yield EXCEPTIONS.get(pattern, pattern), letter + marks
+
+
+def base_rules():
+    # Dibangkitkan saat dibutuhkan (langsung dimasukkan ke trie), urut prioritas
+    yield from SPECIAL
+    yield from _forms([("T", "ة", "a")], TANWIN + SHORT)
+    yield ",", "،"
+    yield from _forms(DIGRAPHS + LETTERS, LONG, doubled=True)
+    yield from _forms(DIGRAPHS, SHORT, doubled=True)
+    yield from _forms(DIGRAPHS, LONG)
+    yield from ALLAH
+    yield from _forms(LETTERS, SHORT, doubled=True)
+    yield from _forms(LETTERS, LONG)
+    yield from _forms(DIGRAPHS + LETTERS, SHORT)
+    for latin, arabic, _ in DIGRAPHS + LETTERS:
+        yield latin, arabic + SUKUN
+    # Hamzah: vokal kapital di atas ء, vokal kecil di awal kata di atas alif
+    for vowels, seats in (("AIU", "ءءء"), ("aiu", "أإأ")):
+        for vowel, seat, (_, tanwin) in zip(vowels, seats, reversed(TANWIN)):
+            yield vowel + "N", seat + tanwin
+        for vowel, seat, (_, mark) in zip(vowels, seats, reversed(SHORT)):
+            yield vowel, seat + mark
+    # Pemisah: ";" memutus pola tanpa menghasilkan huruf
+    yield ";", ""
@@ -0,0 +1,231 @@
+# Render hasil transliterasi ke PNG/PDF tanpa layar, untuk lembar kerja dan
+# gambar kartu dalam jumlah banyak.
+#
+#   python arabin_render.py kartu.txt -o kartu --format png --workers 4
+#
+# Setiap paragraf (dipisah baris kosong) menjadi satu kartu. Dengan --split
+# lines setiap baris menjadi satu kartu, dengan --split file satu berkas utuh.
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtGui import (
+    QGuiApplication, QImage, QPainter, QColor, QFont, QFontMetricsF,
+    QTextLayout, QTextOption, QPdfWriter, QPageSize,
+)
+from PyQt5.QtCore import Qt, QPointF, QSizeF, QMarginsF
+
+from arabin_engine import load_engine
+
+DEFAULT_FONT = "Arabic Typesetting, Arial"
+
+
+class GlyphCache:
+    # Hasil shaping per kata, dipakai ulang lintas dokumen dalam satu proses.
+    # Huruf Arab hanya bersambung di dalam kata, jadi kata yang sama dengan
+    # font yang sama selalu menghasilkan glyph run yang sama.
+
+    def __init__(self):
+        self._runs = {}
+        self.hits = 0
+        self.misses = 0
+
+    def word(self, font, text):
+        key = (font.key(), text)
+        entry = self._runs.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        layout = QTextLayout(text, font)
+        option = QTextOption()
+        option.setTextDirection(Qt.RightToLeft)
+        option.setWrapMode(QTextOption.NoWrap)
+        layout.setTextOption(option)
+        layout.beginLayout()
+        line = layout.createLine()
+        layout.endLayout()
+        entry = (layout.glyphRuns(), line.naturalTextWidth())
+        self._runs[key] = entry
+        return entry
+
+
+class CardRenderer:
+    def __init__(self, options, cache=None):
+        self.options = options
+        self.cache = cache if cache is not None else GlyphCache()
+        self.font = QFont(options.font)
+        self.font.setPixelSize(options.font_size)
+        metrics = QFontMetricsF(self.font)
+        self.space = metrics.horizontalAdvance(" ")
+        self.line_height = metrics.lineSpacing() * options.line_spacing
+
+    def wrap(self, text):
+        # Susun kata per baris (urutan logis); paragraf tetap dipisah
+        width = self.options.width - 2 * self.options.margin
+        lines = []
+        for paragraph in text.split("\n"):
+            line, used = [], 0.0
+            for word in paragraph.split():
+                runs, advance = self.cache.word(self.font, word)
+                needed = advance if not line else used + self.space + advance
+                if line and needed > width:
+                    lines.append(line)
+                    line, needed = [], advance
+                line.append((runs, advance))
+                used = needed
+            lines.append(line)
+        return lines
+
+    def height_for(self, lines):
+        if self.options.height:
+            return self.options.height
+        return int(len(lines) * self.line_height + 2 * self.options.margin + 0.5)
+
+    def paint(self, painter, lines):
+        margin = self.options.margin
+        top = margin
+        for line in lines:
+            # Kanan ke kiri: kata pertama di tepi kanan
+            right = self.options.width - margin
+            for runs, advance in line:
+                right -= advance
+                origin = QPointF(right, top)
+                for run in runs:
+                    painter.drawGlyphRun(origin, run)
+                right -= self.space
+            top += self.line_height
+
+    def render_png(self, text, path):
+        lines = self.wrap(text)
+        # Kartu selalu berlatar penuh, jadi tanpa kanal alfa
+        image = QImage(self.options.width, self.height_for(lines), QImage.Format_RGB32)
+        image.fill(QColor(self.options.background))
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QColor(self.options.color))
+        self.paint(painter, lines)
+        painter.end()
+        # Kompresi zlib adalah bagian terlama; kualitas 80 kira-kira dua kali
+        # lebih cepat dari bawaan dengan berkas hanya sedikit lebih besar
+        if not image.save(path, "PNG", 80):
+            raise OSError("gagal menyimpan %s" % path)
+
+    def render_pdf(self, text, path):
+        lines = self.wrap(text)
+        height = self.height_for(lines)
+        writer = QPdfWriter(path)
+        # Satu piksel kartu = satu titik pada 96 dpi, sama seperti PNG
+        writer.setResolution(96)
+        writer.setPageSize(QPageSize(QSizeF(self.options.width * 0.75, height * 0.75), QPageSize.Point))
+        writer.setPageMargins(QMarginsF(0, 0, 0, 0))
+        painter = QPainter(writer)
+        painter.fillRect(0, 0, self.options.width, height, QColor(self.options.background))
+        painter.setPen(QColor(self.options.color))
+        self.paint(painter, lines)
+        painter.end()
+
+
+# ===== PROSES PEKERJA =====
+_worker = None
+
+
+def _init_worker(options):
+    global _worker
+    app = QGuiApplication.instance() or QGuiApplication([])
+    _worker = (app, CardRenderer(options))
+
+
+def _render_card(job):
+    index, text, path = job
+    renderer = _worker[1]
+    hits, misses = renderer.cache.hits, renderer.cache.misses
+    if path.endswith(".pdf"):
+        renderer.render_pdf(text, path)
+    else:
+        renderer.render_png(text, path)
+    return index, renderer.cache.hits - hits, renderer.cache.misses - misses
+
+
+def split_cards(text, mode):
+    if mode == "file":
+        return [text.strip()] if text.strip() else []
+    if mode == "lines":
+        return [line.strip() for line in text.splitlines() if line.strip()]
+    cards, current = [], []
+    for line in text.splitlines():
+        if line.strip():
+            current.append(line.strip())
+        elif current:
+            cards.append("\n".join(current))
+            current = []
+    if current:
+        cards.append("\n".join(current))
+    return cards
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render hasil transliterasi ke PNG/PDF")
+    parser.add_argument("files", nargs="+", help="berkas teks Latin")
+    parser.add_argument("-o", "--output-dir", default="render", help="folder hasil")
+    parser.add_argument("--format", choices=["png", "pdf"], default="png")
+    parser.add_argument("--split", choices=["blank", "lines", "file"], default="blank",
+                        help="pemisah kartu: baris kosong, setiap baris, atau satu berkas")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--width", type=int, default=1080)
+    parser.add_argument("--height", type=int, default=0, help="0 = mengikuti isi")
+    parser.add_argument("--margin", type=int, default=60)
+    parser.add_argument("--font", default=DEFAULT_FONT)
+    parser.add_argument("--font-size", type=int, default=64, help="ukuran huruf dalam piksel")
+    parser.add_argument("--line-spacing", type=float, default=1.4)
+    parser.add_argument("--color", default="#000000")
+    parser.add_argument("--background", default="#ffffff")
+    parser.add_argument("--no-overlays", action="store_true", help="abaikan aturan pengguna di ~/.arabin")
+    args = parser.parse_args(argv)
+
+    try:
+        engine = load_engine(not args.no_overlays)
+    except ValueError as e:
+        parser.error(str(e))
+
+    cards = []
+    for path in args.files:
+        with open(path, encoding="utf-8") as f:
+            cards.extend(split_cards(f.read(), args.split))
+    os.makedirs(args.output_dir, exist_ok=True)
+    jobs = [
+        (index, engine.transliterate(text), os.path.join(args.output_dir, "kartu-%05d.%s" % (index + 1, args.format)))
+        for index, text in enumerate(cards)
+    ]
+
+    start = time.perf_counter()
+    hits = misses = 0
+    workers = max(1, min(args.workers, len(jobs)))
+    if workers == 1:
+        _init_worker(args)
+        results = map(_render_card, jobs)
+    else:
+        # spawn: proses baru tanpa salinan state Qt milik proses induk
+        context = multiprocessing.get_context("spawn")
+        pool = context.Pool(workers, initializer=_init_worker, initargs=(args,))
+        results = pool.imap_unordered(_render_card, jobs, chunksize=max(1, len(jobs) // (workers * 8)))
+    for _, card_hits, card_misses in results:
+        hits += card_hits
+        misses += card_misses
+    if workers > 1:
+        pool.close()
+        pool.join()
+
+    elapsed = time.perf_counter() - start
+    print("%d kartu -> %s (%.2f detik, %d proses, cache glyph: %d hit / %d miss)"
+          % (len(jobs), args.output_dir, elapsed, workers, hits, misses), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
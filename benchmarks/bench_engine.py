@@ -0,0 +1,117 @@
+# Benchmark waktu konversi RuleEngine dibandingkan rantai re.sub asli, tanpa Qt.
+#
+#   python benchmarks/bench_engine.py --sizes 100000 1000000 --output mesin.json
+#
+# Rantai re.sub dibangun dari ArabinV1.0.0.py di revisi git --legacy (lihat
+# tools/check_rules.py), jadi perlu dijalankan dari dalam repositori git.
+# Dua jenis dokumen diukur: "sample" mengulang kalimat yang sama (seperti teks
+# biasa, kata yang sama muncul berkali-kali) dan "unique" berisi kata acak
+# yang jarang berulang, kasus terburuk bagi memo per kata di RuleEngine.
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tools"))
+
+from arabin_engine import RuleEngine
+from check_rules import legacy_rules
+
+SAMPLE = (
+    "bismi --llohi --rrohmaani --rrohiimi. --lhamdu lillaahi robbi --l'aalamiina, "
+    "--rrohmaani --rrohiimi. maaliki yawmi --ddiini. iyyaaka na'budu wa iyyaaka nasta'iinu. "
+)
+
+SYLLABLES = (
+    "ba bi bu taa kha dd sy ll rro mi nu waa yi 'a qo lloh aN iN uN dza th ch gh"
+).split()
+
+
+def make_documents(size, seed):
+    rng = random.Random(seed)
+    words = []
+    length = 0
+    while length < size:
+        word = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 5)))
+        words.append(word)
+        length += len(word) + 1
+    return {
+        "sample": (SAMPLE * (size // len(SAMPLE) + 1))[:size],
+        "unique": " ".join(words)[:size],
+    }
+
+
+def timed(function, text, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RuleEngine terhadap rantai re.sub asli")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000],
+                        help="ukuran dokumen dalam karakter")
+    parser.add_argument("--repeat", type=int, default=3, help="putaran per ukuran (diambil yang tercepat)")
+    parser.add_argument("--legacy", default="bd37135", help="revisi git dengan rantai re.sub asli")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="simpan JSON ke berkas (default: stdout)")
+    args = parser.parse_args()
+
+    rules = legacy_rules(args.legacy)
+
+    def legacy(text):
+        for _, pattern, replacement in rules:
+            text = pattern.sub(replacement, text)
+        return text
+
+    report = {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "legacy": args.legacy,
+        "repeat": args.repeat,
+        "unit": "s",
+        "sizes": {},
+    }
+    for size in args.sizes:
+        results = {}
+        for name, text in make_documents(size, args.seed).items():
+            # Mesin baru setiap dokumen: memo per kata mulai kosong, dan putaran
+            # pertama (terhitung dalam "cold") mengisinya
+            engine = RuleEngine()
+            start = time.perf_counter()
+            expected = engine.transliterate(text)
+            cold = time.perf_counter() - start
+            warm, _ = timed(engine.transliterate, text, args.repeat)
+            old, output = timed(legacy, text, args.repeat)
+            if output != expected:
+                print("GAGAL: hasil RuleEngine berbeda dari rantai re.sub (%s, %d)" % (name, size), file=sys.stderr)
+                return 1
+            results[name] = {
+                "engine_cold": round(cold, 4),
+                "engine_warm": round(warm, 4),
+                "legacy": round(old, 4),
+                "speedup_cold": round(old / cold, 2),
+            }
+        report["sizes"][str(size)] = results
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
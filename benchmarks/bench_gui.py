@@ -0,0 +1,215 @@
+# Benchmark latensi jendela Arabin tanpa layar (Qt offscreen).
+#
+#   python benchmarks/bench_gui.py --sizes 1000 10000 100000 --output hasil.json
+#
+# Setiap ukuran dokumen menjalankan sesi ketik dan sesi tempel yang sama,
+# lalu mencatat persentil latensi tiap interaksi dalam milidetik (JSON).
+
+import argparse
+import importlib.util
+import json
+import math
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt, QTimer, QT_VERSION_STR, PYQT_VERSION_STR
+from PyQt5.QtTest import QTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SAMPLE = (
+    "bismi --llohi --rrohmaani --rrohiimi. --lhamdu lillaahi robbi --l'aalamiina, "
+    "--rrohmaani --rrohiimi. maaliki yawmi --ddiini. iyyaaka na'budu wa iyyaaka nasta'iinu. "
+)
+
+# Kalimat yang diketik huruf demi huruf di akhir dokumen
+TYPED = "qul huwa --llohu ahadun"
+
+
+def load_app():
+    # Nama berkas aplikasi mengandung titik, jadi dimuat lewat path
+    spec = importlib.util.spec_from_file_location("arabin_app", os.path.join(ROOT, "ArabinV1.0.0.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_document(size):
+    return (SAMPLE * (size // len(SAMPLE) + 1))[:size]
+
+
+def percentiles(samples):
+    ordered = sorted(samples)
+
+    def rank(p):
+        # Nearest-rank
+        index = max(0, math.ceil(p / 100.0 * len(ordered)) - 1)
+        return round(ordered[index], 3)
+
+    return {
+        "n": len(ordered),
+        "p50": rank(50),
+        "p90": rank(90),
+        "p99": rank(99),
+        "max": round(ordered[-1], 3),
+        "mean": round(sum(ordered) / len(ordered), 3),
+    }
+
+
+def timed(action):
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) * 1000.0
+
+
+def close_dialog_later():
+    # NotificationDialog bersifat modal; tutup begitu exec_() mulai berjalan
+    def close():
+        dialog = QApplication.activeModalWidget()
+        if dialog is not None:
+            dialog.accept()
+    QTimer.singleShot(0, close)
+
+
+def measure_transliterate(window, results):
+    # Cache dikosongkan dulu agar "transliterate" selalu konversi sungguhan
+    # (miss); panggilan kedua dengan teks yang sama dicatat terpisah (hit)
+    window.cache.clear()
+    for name in ("transliterate", "transliterate_cached"):
+        results[name].append(timed(lambda: (
+            window.transliterate(),
+            window.text_output.viewport().repaint(),
+        )))
+
+
+def run_size(window, size, repeat):
+    document = make_document(size)
+    results = {name: [] for name in (
+        "keypress", "transliterate", "transliterate_cached", "engine", "set_plain_text", "layout",
+        "paste", "theme_toggle", "copy_notification",
+    )}
+    text_input = window.text_input
+    text_output = window.text_output
+
+    for _ in range(repeat):
+        # ===== SESI KETIK =====
+        window.reset_text()
+        text_input.setPlainText(document)
+        text_input.moveCursor(text_input.textCursor().End)
+        QApplication.processEvents()
+        for char in TYPED:
+            # Waktu dari kirim tombol sampai text_input selesai digambar ulang
+            results["keypress"].append(timed(lambda: (
+                QTest.keyClicks(text_input, char),
+                text_input.viewport().repaint(),
+            )))
+        measure_transliterate(window, results)
+
+        # Rincian tahap transliterasi
+        input_text = text_input.toPlainText().strip()
+        output_text = []
+        results["engine"].append(timed(lambda: output_text.append(window.engine.transliterate(input_text))))
+        results["set_plain_text"].append(timed(lambda: text_output.setPlainText(output_text[0])))
+        results["layout"].append(timed(lambda: (
+            text_output.document().documentLayout().documentSize(),
+            text_output.viewport().repaint(),
+        )))
+
+        # ===== SESI TEMPEL =====
+        window.reset_text()
+        QApplication.clipboard().setText(document)
+        QApplication.processEvents()
+        results["paste"].append(timed(lambda: (
+            QTest.keyClick(text_input, Qt.Key_V, Qt.ControlModifier),
+            text_input.viewport().repaint(),
+        )))
+        measure_transliterate(window, results)
+
+        # ===== TEMA & SALIN =====
+        for _ in range(2):
+            results["theme_toggle"].append(timed(lambda: (
+                window.toggle_mode(),
+                window.repaint(),
+            )))
+        close_dialog_later()
+        results["copy_notification"].append(timed(window.copy_output))
+
+    return {name: percentiles(samples) for name, samples in results.items()}
+
+
+def compare(report, baseline, tolerance):
+    # Bandingkan p90 dengan hasil sebelumnya; kembalikan daftar regresi
+    regressions = []
+    for size, interactions in report["sizes"].items():
+        for name, stats in interactions.items():
+            old = baseline.get("sizes", {}).get(size, {}).get(name)
+            if old and stats["p90"] > old["p90"] * (1.0 + tolerance):
+                regressions.append("%s @ %s karakter: p90 %.3f ms -> %.3f ms" % (name, size, old["p90"], stats["p90"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark latensi GUI Arabin (offscreen)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="ukuran dokumen dalam karakter")
+    parser.add_argument("--repeat", type=int, default=5, help="jumlah pengulangan per ukuran")
+    parser.add_argument("--output", help="simpan JSON ke berkas (default: stdout)")
+    parser.add_argument("--baseline", help="JSON hasil sebelumnya untuk dibandingkan")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="kenaikan p90 yang masih diterima (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    # HOME sementara: aturan pengguna di ~/.arabin milik mesin ini tidak ikut
+    # dimuat, jadi hasil antarmesin bisa dibandingkan dengan --baseline.
+    # Cache hasil juga diarahkan ke sana, bukan ke ~/.cache/arabin pengguna.
+    home = tempfile.mkdtemp(prefix="arabin-bench-")
+    os.environ["HOME"] = home
+    os.environ["XDG_CACHE_HOME"] = os.path.join(home, ".cache")
+
+    app = QApplication(sys.argv)
+    module = load_app()
+    window = module.Transliterator()
+    window.show()
+    QApplication.processEvents()
+
+    report = {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "pyqt": PYQT_VERSION_STR,
+        "qpa": os.environ["QT_QPA_PLATFORM"],
+        "repeat": args.repeat,
+        "unit": "ms",
+        "sizes": {},
+    }
+    for size in args.sizes:
+        report["sizes"][str(size)] = run_size(window, size, args.repeat)
+
+    window.close()
+    shutil.rmtree(home, ignore_errors=True)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print("REGRESI: " + line, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
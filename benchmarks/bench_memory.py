@@ -0,0 +1,128 @@
+# Benchmark puncak memori konversi (tracemalloc), tanpa Qt.
+#
+#   python benchmarks/bench_memory.py --sizes 1 2 --output memori.json
+#
+# Yang diukur adalah alokasi baru selama konversi (input sudah ada sebelum
+# pengukuran dimulai), dibagi ukuran input dalam MB. Skrip keluar dengan kode 1
+# jika ada skenario yang melewati anggarannya (MB puncak per MB input).
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from arabin_cache import ResultCache
+from arabin_engine import RuleEngine
+
+SAMPLE = (
+    "bismi --llohi --rrohmaani --rrohiimi. --lhamdu lillaahi robbi --l'aalamiina, "
+    "--rrohmaani --rrohiimi. maaliki yawmi --ddiini. iyyaaka na'budu wa iyyaaka nasta'iinu.\n"
+)
+
+MB = 1024 * 1024
+
+# Anggaran puncak per MB input. Hasil Arab (UCS-2) kira-kira 2,3 MB per MB
+# input ASCII; jalur yang mengembalikan str utuh memegang potongan hasil dan
+# gabungannya sekaligus (sekitar 2x hasil). Streaming, termasuk membaca entri
+# cache, hanya memegang satu potongan, jadi rasionya mengecil seiring ukuran
+# input (anggaran ini untuk input 1 MB ke atas).
+BUDGETS = {
+    "engine": 5.0,
+    "engine_diagnostics": 5.0,
+    "stream": 0.5,
+    "cache_miss": 5.0,
+    "cache_hit": 5.0,
+    "stream_cache_hit": 0.5,
+    "cache_miss_diagnostics": 5.0,
+    "cache_hit_diagnostics": 5.0,
+}
+
+
+def make_text(size):
+    return (SAMPLE * (size // len(SAMPLE) + 1))[:size]
+
+
+def drain(chunks):
+    for _ in chunks:
+        pass
+
+
+def scenarios(engine, cache):
+    return {
+        "engine": lambda text: engine.transliterate(text),
+        "engine_diagnostics": lambda text: engine.transliterate(text, []),
+        "stream": lambda text: drain(engine.iter_transliterate(text)),
+        "cache_miss": lambda text: cache.transliterate(engine, text),
+        "cache_hit": lambda text: cache.transliterate(engine, text),
+        "stream_cache_hit": lambda text: drain(cache.iter_transliterate(engine, text)),
+        "cache_miss_diagnostics": lambda text: cache.transliterate(engine, text, []),
+        "cache_hit_diagnostics": lambda text: cache.transliterate(engine, text, []),
+    }
+
+
+def measure(function, text):
+    tracemalloc.start()
+    try:
+        result = function(text)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark puncak memori konversi Arabin")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1, 2], help="ukuran input dalam MB")
+    parser.add_argument("--budget", type=float, help="anggaran MB per MB input untuk semua skenario")
+    parser.add_argument("--output", help="simpan JSON ke berkas (default: stdout)")
+    args = parser.parse_args()
+
+    engine = RuleEngine()
+    directory = tempfile.mkdtemp(prefix="arabin-bench-")
+    cache = ResultCache(directory)
+    report = {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "unit": "MB puncak per MB input",
+        "budgets": {name: args.budget or budget for name, budget in BUDGETS.items()},
+        "sizes": {},
+    }
+    failures = []
+    try:
+        for size in args.sizes:
+            text = make_text(int(size * MB))
+            results = {}
+            # Urutan skenario penting: miss mengisi cache untuk hit berikutnya
+            for name, function in scenarios(engine, cache).items():
+                ratio = measure(function, text) / len(text)
+                budget = report["budgets"][name]
+                results[name] = round(ratio, 3)
+                if ratio > budget:
+                    failures.append("%s @ %g MB: %.2f > %.2f" % (name, size, ratio, budget))
+            report["sizes"][str(size)] = results
+            cache.clear()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    for line in failures:
+        print("MELEBIHI ANGGARAN: " + line, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
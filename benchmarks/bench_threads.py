@@ -0,0 +1,114 @@
+# Benchmark skala thread: satu RuleEngine bersama, 1..N thread.
+#
+#   python benchmarks/bench_threads.py --threads 1 2 4 8 --output standar.json
+#   python3.13t benchmarks/bench_threads.py --threads 1 2 4 8 --output bebas-gil.json
+#
+# Hanya memakai pustaka standar, jadi bisa dijalankan di interpreter
+# free-threaded tanpa PyQt5/NumPy. Hasilnya berupa JSON: throughput (nilai/detik
+# dan karakter/detik) per jumlah thread beserta percepatannya terhadap 1 thread.
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import sysconfig
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from arabin_engine import RuleEngine
+from arabin_batch import ThreadedTransliterator
+
+WORDS = (
+    "bismi --llohi --rrohmaani --rrohiimi --lhamdu lillaahi robbi --l'aalamiina "
+    "maaliki yawmi --ddiini iyyaaka na'budu wa iyyaaka nasta'iinu muhammad "
+    "faathimah 'abdullohi khodiijah zaynab yuusuf ibroohiim sulaymaan"
+).split()
+
+
+def make_values(count, seed):
+    # Nilai pendek seperti kolom nama/kalimat, sama untuk setiap jumlah thread
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 12))) for _ in range(count)]
+
+
+def gil_enabled():
+    check = getattr(sys, "_is_gil_enabled", None)
+    return check() if check else True
+
+
+def run_threads(engine, values, threads, repeat, chunk_size):
+    with ThreadedTransliterator(engine, threads, chunk_size) as converter:
+        # Pemanasan: thread kumpulan dibuat sebelum waktu diukur
+        converter.transliterate(values[:threads * chunk_size])
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            converter.transliterate(values)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skala thread RuleEngine")
+    parser.add_argument("--threads", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}), help="jumlah thread yang diuji")
+    parser.add_argument("--values", type=int, default=50000, help="jumlah nilai per putaran")
+    parser.add_argument("--chunk-size", type=int, default=256, help="nilai per tugas thread")
+    parser.add_argument("--repeat", type=int, default=3, help="putaran per jumlah thread (diambil yang tercepat)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="simpan JSON ke berkas (default: stdout)")
+    args = parser.parse_args()
+
+    engine = RuleEngine()
+    values = make_values(args.values, args.seed)
+    characters = sum(len(value) for value in values)
+
+    # Hasil paralel harus sama persis dengan hasil berurutan
+    expected = [engine.transliterate(value) for value in values[:2000]]
+    with ThreadedTransliterator(engine, max(args.threads), args.chunk_size) as converter:
+        if converter.transliterate(values[:2000]) != expected:
+            print("GAGAL: hasil paralel berbeda dari hasil berurutan", file=sys.stderr)
+            return 1
+
+    report = {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "free_threaded_build": bool(sysconfig.get_config_var("Py_GIL_DISABLED")),
+        "gil_enabled": gil_enabled(),
+        "cpu_count": os.cpu_count(),
+        "values": len(values),
+        "characters": characters,
+        "chunk_size": args.chunk_size,
+        "repeat": args.repeat,
+        "threads": {},
+    }
+    # Percepatan dihitung terhadap 1 thread (jika ikut diuji)
+    single = None
+    for threads in sorted(set(args.threads)):
+        elapsed = run_threads(engine, values, threads, args.repeat, args.chunk_size)
+        if threads == 1:
+            single = elapsed
+        report["threads"][str(threads)] = {
+            "seconds": round(elapsed, 4),
+            "values_per_second": round(len(values) / elapsed),
+            "characters_per_second": round(characters / elapsed),
+            "speedup": round(single / elapsed, 2) if single else None,
+        }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+# Pemeriksaan regresi tabel aturan dasar terhadap korpus beku.
+#
+#   python tools/check_rules.py
+#   python tools/check_rules.py --generate bd37135
+#
+# rules_corpus.jsonl berisi pasangan [input, output] yang dihasilkan oleh
+# rantai 540 re.sub di ArabinV1.0.0.py versi awal (sebelum RuleEngine dan
+# tata bahasa aturan). Setiap perubahan pada tata bahasa, EXCEPTIONS, atau
+# pencocok yang mengubah hasil akan terlihat di sini; skrip keluar dengan
+# kode 1 jika ada yang berbeda.
+#
+# --generate REV membangun ulang korpus dari rantai re.sub di revisi git
+# REV, jadi korpus selalu bisa ditelusuri ke tabel aslinya.
+
+import argparse
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from arabin_engine import RuleEngine
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rules_corpus.jsonl")
+
+LEGACY_RE = re.compile(r"\s*output_text = re\.sub\(r'((?:\\'|[^'])*)', '([^']*)', output_text\)$")
+
+# Potongan yang sering saling tumpang tindih, untuk input acak
+COMMON = (
+    "a i u aa ii uu oo aN iN uN A I U AN IN UN dd dz dh dl ch gh kh sh sy th ts "
+    "ll llo lloo qqo qqoo rro rron thon choN saw ' '' T TuN -- - ; ,"
+).split()
+ALPHABET = "abcdefghijklmnopqrstuvwxyzAIUNT'-,; .\n"
+SENTENCES = [
+    "bismi --llohi --rrohmaani --rrohiimi",
+    "--lhamdu lillaahi robbi --l'aalamiina",
+    "maaliki yawmi --ddiini, iyyaaka na'budu wa iyyaaka nasta'iinu",
+    "qul huwa --llohu ahadun",
+    "dzaalika --lkitaabu laa royba fiihi",
+    "muhammad faathimah 'abdullohi khodiijah",
+]
+
+
+def legacy_rules(revision):
+    source = subprocess.run(["git", "show", "%s:ArabinV1.0.0.py" % revision], cwd=ROOT,
+                            check=True, capture_output=True).stdout.decode("utf-8")
+    rules = []
+    for line in source.splitlines():
+        if "output_text = re.sub(" in line:
+            match = LEGACY_RE.match(line)
+            # Pola ditulis sebagai r'...' dengan \' untuk kutip tunggal
+            rules.append((match.group(1).replace("\\'", "'"), re.compile(match.group(1)), match.group(2)))
+    return rules
+
+
+def make_inputs(patterns, seed=1):
+    rng = random.Random(seed)
+    inputs = list(SENTENCES)
+    inputs.extend(patterns)
+    for _ in range(2000):
+        inputs.append("".join(rng.choice(patterns) for _ in range(rng.randint(2, 4))))
+    for _ in range(2000):
+        parts = [rng.choice(COMMON) if rng.random() < 0.5 else rng.choice(ALPHABET)
+                 for _ in range(rng.randint(1, 12))]
+        inputs.append("".join(parts))
+    # Tanpa duplikat, urutan tetap
+    return list(dict.fromkeys(inputs))
+
+
+def generate(revision):
+    rules = legacy_rules(revision)
+    patterns = sorted({literal for literal, _, _ in rules})
+    with open(CORPUS, "w", encoding="utf-8") as f:
+        for text in make_inputs(patterns):
+            output = text
+            for _, pattern, replacement in rules:
+                output = pattern.sub(replacement, output)
+            f.write(json.dumps([text, output], ensure_ascii=False) + "\n")
+    print("%d aturan, korpus ditulis ke %s" % (len(rules), CORPUS))
+    return 0
+
+
+def check():
+    engine = RuleEngine()
+    total = 0
+    failures = []
+    with open(CORPUS, encoding="utf-8") as f:
+        for line in f:
+            text, expected = json.loads(line)
+            total += 1
+            output = engine.transliterate(text)
+            if output != expected:
+                failures.append((text, expected, output))
+    for text, expected, output in failures[:20]:
+        print("BERBEDA: %r -> %r (seharusnya %r)" % (text, output, expected), file=sys.stderr)
+    print("%d input, %d berbeda" % (total, len(failures)))
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bandingkan RuleEngine dengan korpus dari tabel re.sub asli")
+    parser.add_argument("--generate", metavar="REV", help="bangun ulang korpus dari ArabinV1.0.0.py di revisi git REV")
+    args = parser.parse_args()
+    return generate(args.generate) if args.generate else check()
+
+
+if __name__ == "__main__":
+    sys.exit(main())